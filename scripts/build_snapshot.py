@@ -42,11 +42,15 @@ Usage:
     python scripts/build_snapshot.py --environment production --stack gcp-stack --pipeline batch_inference
 """
 
+import json
 import os
 import sys
+import tempfile
 from pathlib import Path
 from typing import Optional
 
+import yaml
+
 # Add project root to Python path for imports
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
@@ -59,6 +63,94 @@ logger = get_logger(__name__)
 
 SNAPSHOT_PREFIX = "readmission_model"
 
+# Stack name -> UUID cache, shared across CI invocations in the same job
+STACK_ID_CACHE = Path.home() / ".cache" / "zenml_stack_ids.json"
+
+
+def _read_stack_id_cache() -> dict:
+    """Load the on-disk stack ID cache, treating a corrupt file as empty."""
+    try:
+        return json.loads(STACK_ID_CACHE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_stack_id_cache(cache: dict) -> None:
+    """Atomically write the stack ID cache (best effort)."""
+    try:
+        STACK_ID_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=STACK_ID_CACHE.parent, delete=False, suffix=".tmp"
+        ) as f:
+            json.dump(cache, f)
+        Path(f.name).replace(STACK_ID_CACHE)
+    except OSError as e:
+        logger.warning("Could not write stack ID cache: %s", e)
+
+
+def load_pipeline_config(environment: str) -> dict:
+    """Parse configs/<environment>.yaml into with_options() keyword arguments.
+
+    Passing the parsed dict instead of config_path means the YAML is read
+    once here rather than again by ZenML when the snapshot is compiled.
+    """
+    config_path = project_root / "configs" / f"{environment}.yaml"
+    with config_path.open() as f:
+        return yaml.safe_load(f) or {}
+
+
+def resolve_stack_id(stack_name: str, refresh: bool = False) -> str:
+    """Resolve a stack name to its UUID, avoiding a Client() init when cached.
+
+    Cache entries are keyed by the active store URL and stack name, so the
+    same stack name in dev-staging and production never collides. A cached
+    ID is returned without contacting the server; main() re-resolves it by
+    name if creating the snapshot then fails to find the stack.
+
+    Args:
+        stack_name: Name of the stack to resolve
+        refresh: Ignore any cached entry and re-fetch from the server
+
+    Returns:
+        The stack UUID as a string
+    """
+    from zenml.config.global_config import GlobalConfiguration
+
+    store_url = GlobalConfiguration().store_configuration.url
+    key = f"{store_url}::{stack_name}"
+
+    cache = _read_stack_id_cache()
+    if not refresh and key in cache:
+        return cache[key]
+
+    stack_id = str(Client().get_stack(stack_name).id)
+    cache[key] = stack_id
+    _write_stack_id_cache(cache)
+    return stack_id
+
+
+def create_snapshot(pipeline: str, environment: str, name: str):
+    """Snapshot the selected pipeline on the active stack.
+
+    Args:
+        pipeline: "training" or "batch_inference"
+        environment: "staging" or "production"
+        name: Snapshot name
+
+    Returns:
+        The created snapshot
+    """
+    if pipeline == "training":
+        from src.pipelines.training import training_pipeline
+
+        return training_pipeline.with_options(
+            **load_pipeline_config(environment),
+        ).create_snapshot(name=name)
+
+    from src.pipelines.batch_inference import batch_inference_pipeline
+
+    return batch_inference_pipeline.create_snapshot(name=name)
+
 
 def get_snapshot_name(
     environment: str,
@@ -106,7 +198,6 @@ def get_snapshot_name(
     "--git-sha",
     type=str,
     default=None,
-    envvar="ZENML_GITHUB_SHA",
     help="Git SHA for snapshot naming (auto from ZENML_GITHUB_SHA env var)",
 )
 @click.option(
@@ -120,6 +211,11 @@ def get_snapshot_name(
     default="training",
     help="Which pipeline to snapshot",
 )
+@click.option(
+    "--refresh-cache",
+    is_flag=True,
+    help="Re-resolve the stack ID from the server instead of the local cache",
+)
 def main(
     environment: str,
     stack: str,
@@ -127,6 +223,7 @@ def main(
     git_sha: Optional[str] = None,
     run: bool = False,
     pipeline: str = "training",
+    refresh_cache: bool = False,
 ):
     """Build a pipeline snapshot for deployment.
 
@@ -134,48 +231,45 @@ def main(
     - Staging: Create snapshot AND run (continuous training)
     - Production: Create snapshot only (manual approval to run)
     """
-    client = Client()
-
     # Set active stack
-    remote_stack = client.get_stack(stack)
-    os.environ["ZENML_ACTIVE_STACK_ID"] = str(remote_stack.id)
-    logger.info(f"Using stack: {remote_stack.name}")
+    os.environ["ZENML_ACTIVE_STACK_ID"] = resolve_stack_id(stack, refresh=refresh_cache)
 
     # Generate snapshot name if not provided
     if name is None:
+        git_sha = git_sha or os.environ.get("ZENML_GITHUB_SHA")
         name = get_snapshot_name(environment=environment, git_sha=git_sha)
 
-    logger.info(f"Creating snapshot: {name}")
-    logger.info(f"Environment: {environment}")
-    logger.info(f"Pipeline: {pipeline}")
-
-    # Import and snapshot the appropriate pipeline
-    if pipeline == "training":
-        from src.pipelines.training import training_pipeline
-
-        snapshot = training_pipeline.with_options(
-            config_path=f"configs/{environment}.yaml",
-        ).create_snapshot(name=name)
-
-    elif pipeline == "batch_inference":
-        from src.pipelines.batch_inference import batch_inference_pipeline
-
-        snapshot = batch_inference_pipeline.create_snapshot(name=name)
-
-    logger.info(f"Snapshot created: {snapshot.id}")
-    logger.info(f"   Name: {snapshot.name}")
+    logger.info(
+        "Creating snapshot:\n  name=%s\n  environment=%s\n  pipeline=%s\n  stack=%s",
+        name,
+        environment,
+        pipeline,
+        stack,
+    )
+
+    try:
+        snapshot = create_snapshot(pipeline, environment, name)
+    except KeyError:
+        if refresh_cache:
+            raise
+        # The cached stack ID is stale (stack deleted or recreated)
+        logger.warning("Stack %s not found by cached ID, re-resolving it", stack)
+        os.environ["ZENML_ACTIVE_STACK_ID"] = resolve_stack_id(stack, refresh=True)
+        snapshot = create_snapshot(pipeline, environment, name)
+
+    logger.info("Snapshot created: %s\n   Name: %s", snapshot.id, snapshot.name)
 
     # Optionally trigger the run
     if run:
         logger.info("Triggering pipeline run from snapshot...")
 
         run_config = snapshot.config_template
-        run_response = client.trigger_pipeline(
+        run_response = Client().trigger_pipeline(
             snapshot_name_or_id=snapshot.id,
             run_configuration=run_config,
         )
 
-        logger.info(f"Pipeline run triggered: {run_response.id}")
+        logger.info("Pipeline run triggered: %s", run_response.id)
     else:
         logger.info(
             "Snapshot created but not run. Trigger manually via UI or API when ready."
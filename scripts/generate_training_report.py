@@ -28,6 +28,7 @@ Usage:
 
 import os
 import sys
+import types
 from pathlib import Path
 
 import click
@@ -41,6 +42,35 @@ from zenml.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Report status badges and next-step blocks
+SUCCESS_BADGE = "✅ PASS"
+FAILURE_BADGE = "❌ FAIL"
+NEXT_STEPS_PASSED = """
+- ✅ Model meets all quality gates
+- 🔄 Merge PR to promote to staging
+- 🚀 Create a release to promote to production
+"""
+NEXT_STEPS_FAILED = """
+- ❌ Model did not meet quality gates
+- 🔍 Review failed checks above
+- 🔧 Fix issues and push new commit
+"""
+
+# CI-provided git context, resolved once at import (ZENML_* wins over GITHUB_*)
+_ENV = types.MappingProxyType(
+    {
+        "GIT_SHA": os.environ.get(
+            "ZENML_GITHUB_SHA", os.environ.get("GITHUB_SHA", "unknown")
+        )[:7],
+        "PR_URL": os.environ.get(
+            "ZENML_GITHUB_PR_URL", os.environ.get("GITHUB_PR_URL", "")
+        ),
+    }
+)
+
+# Coalesce report writes into as few syscalls as possible (helps on FUSE/NFS)
+WRITE_BUFFER_SIZE = 1024 * 1024
+
 
 def get_latest_training_run(client: Client, pipeline_name: str = "training_pipeline"):
     """Get the most recent training pipeline run.
@@ -57,6 +87,7 @@ def get_latest_training_run(client: Client, pipeline_name: str = "training_pipel
             pipeline_name=pipeline_name,
             sort_by="desc:created",
             size=1,
+            hydrate=False,  # Only body fields are needed; steps load on demand
         )
         if runs:
             return runs[0]
@@ -66,10 +97,14 @@ def get_latest_training_run(client: Client, pipeline_name: str = "training_pipel
     return None
 
 
-def extract_metrics_from_run(run) -> dict:
+def extract_metrics_from_run(client: Client, run) -> dict:
     """Extract metrics from a pipeline run.
 
+    Model version metadata is checked first since it is a single field on the
+    run; step outputs are only fetched when it is missing.
+
     Args:
+        client: ZenML client
         run: Pipeline run object
 
     Returns:
@@ -77,30 +112,37 @@ def extract_metrics_from_run(run) -> dict:
     """
     metrics = {}
 
-    # Try to get metrics from the evaluate_model step
+    # Fast path: metrics logged to the model version by evaluate_model
     try:
-        for step_name, step_run in run.steps.items():
-            if "evaluate" in step_name.lower() or "metrics" in step_name.lower():
-                for output_name, artifact in step_run.outputs.items():
-                    if "metrics" in output_name.lower():
-                        metrics = artifact.load()
-                        break
+        model = run.model
+        if model:
+            run_metadata = model.run_metadata or {}
+            for key in ["accuracy", "precision", "recall", "f1_score", "roc_auc"]:
+                if key in run_metadata:
+                    value = run_metadata[key]
+                    metrics[key] = value.value if hasattr(value, "value") else value
     except Exception as e:
-        logger.warning(f"Could not extract metrics: {e}")
+        logger.warning(f"Could not extract metrics from model version: {e}")
 
-    # Fallback: try model version metadata
+    # Fallback: load the metrics artifact from the evaluation step, fetching
+    # only matching steps instead of hydrating the whole run's step graph
     if not metrics:
         try:
-            # Get model version from run
-            model = run.model
-            if model:
-                run_metadata = model.run_metadata or {}
-                for key in ["accuracy", "precision", "recall", "f1_score", "roc_auc"]:
-                    if key in run_metadata:
-                        value = run_metadata[key]
-                        metrics[key] = value.value if hasattr(value, "value") else value
+            step_runs = client.list_run_steps(
+                pipeline_run_id=run.id,
+                name="contains:evaluate",
+                size=5,
+                hydrate=True,
+            )
+            for step_run in step_runs:
+                for output_name, artifact in step_run.outputs.items():
+                    if "metrics" in output_name.lower():
+                        metrics = artifact.load()
+                        break
+                if metrics:
+                    break
         except Exception as e:
-            logger.warning(f"Could not extract metrics from model version: {e}")
+            logger.warning(f"Could not extract metrics: {e}")
 
     return metrics
 
@@ -138,8 +180,8 @@ def generate_report(
         model_version = run.model.version
 
     # Get git info from environment
-    git_sha = os.environ.get("ZENML_GITHUB_SHA", os.environ.get("GITHUB_SHA", "unknown"))[:7]
-    pr_url = os.environ.get("ZENML_GITHUB_PR_URL", os.environ.get("GITHUB_PR_URL", ""))
+    git_sha = _ENV["GIT_SHA"]
+    pr_url = _ENV["PR_URL"]
 
     # Calculate pass/fail
     accuracy = metrics.get("accuracy", 0)
@@ -151,12 +193,23 @@ def generate_report(
     acc_pass = accuracy >= min_accuracy
     prec_pass = precision >= min_precision
     rec_pass = recall >= min_recall
+    perf_pass = acc_pass and prec_pass and rec_pass
     run_success = status == "completed"
 
-    overall_passed = acc_pass and prec_pass and rec_pass and run_success
+    overall_passed = perf_pass and run_success
     decision = "✅ **PASSED**" if overall_passed else "❌ **FAILED**"
 
-    # Build report
+    # Resolve each status label once
+    run_status = SUCCESS_BADGE if run_success else FAILURE_BADGE
+    perf_status = SUCCESS_BADGE if perf_pass else FAILURE_BADGE
+    acc_status = SUCCESS_BADGE if acc_pass else FAILURE_BADGE
+    prec_status = SUCCESS_BADGE if prec_pass else FAILURE_BADGE
+    rec_status = SUCCESS_BADGE if rec_pass else FAILURE_BADGE
+
+    next_steps = NEXT_STEPS_PASSED if overall_passed else NEXT_STEPS_FAILED
+    pr_link = f"- [Pull Request]({pr_url})\n" if pr_url else ""
+
+    # Build report in one pass
     report = f"""# Training Report
 
 **Model**: `{model_name}` (v{model_version})
@@ -171,8 +224,8 @@ def generate_report(
 
 | Category | Status |
 |----------|--------|
-| Pipeline Execution | {'✅ PASS' if run_success else '❌ FAIL'} |
-| Model Performance | {'✅ PASS' if (acc_pass and prec_pass and rec_pass) else '❌ FAIL'} |
+| Pipeline Execution | {run_status} |
+| Model Performance | {perf_status} |
 
 ---
 
@@ -180,9 +233,9 @@ def generate_report(
 
 | Metric | Threshold | Actual | Result |
 |--------|-----------|--------|--------|
-| Accuracy | ≥{min_accuracy:.1%} | {accuracy:.2%} | {'✅ PASS' if acc_pass else '❌ FAIL'} |
-| Precision | ≥{min_precision:.1%} | {precision:.2%} | {'✅ PASS' if prec_pass else '❌ FAIL'} |
-| Recall | ≥{min_recall:.1%} | {recall:.2%} | {'✅ PASS' if rec_pass else '❌ FAIL'} |
+| Accuracy | ≥{min_accuracy:.1%} | {accuracy:.2%} | {acc_status} |
+| Precision | ≥{min_precision:.1%} | {precision:.2%} | {prec_status} |
+| Recall | ≥{min_recall:.1%} | {recall:.2%} | {rec_status} |
 | F1 Score | - | {f1:.2%} | ℹ️ INFO |
 | ROC AUC | - | {roc_auc:.2%} | ℹ️ INFO |
 
@@ -190,30 +243,13 @@ def generate_report(
 
 ## Next Steps
 
-"""
-
-    if overall_passed:
-        report += """
-- ✅ Model meets all quality gates
-- 🔄 Merge PR to promote to staging
-- 🚀 Create a release to promote to production
-"""
-    else:
-        report += """
-- ❌ Model did not meet quality gates
-- 🔍 Review failed checks above
-- 🔧 Fix issues and push new commit
-"""
-
-    report += f"""
+{next_steps}
 ---
 
 ## Links
 
 - [ZenML Dashboard](https://cloud.zenml.io)
-"""
-    if pr_url:
-        report += f"- [Pull Request]({pr_url})\n"
+{pr_link}"""
 
     return report, overall_passed
 
@@ -269,14 +305,14 @@ Could not find any runs for pipeline `{pipeline}`.
 
 Please ensure the training pipeline has completed before generating the report.
 """
-        with open(output, "w") as f:
-            f.write(fallback_report)
+        with open(output, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(fallback_report.encode("utf-8"))
         sys.exit(1)
 
     logger.info(f"Found run: {run.id}")
 
     # Extract metrics
-    metrics = extract_metrics_from_run(run)
+    metrics = extract_metrics_from_run(client, run)
     logger.info(f"Extracted metrics: {metrics}")
 
     # Generate report
@@ -289,8 +325,8 @@ Please ensure the training pipeline has completed before generating the report.
     )
 
     # Write report
-    with open(output, "w") as f:
-        f.write(report)
+    with open(output, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(report.encode("utf-8"))
 
     logger.info(f"Report written to {output}")
     logger.info(f"Overall result: {'PASSED' if passed else 'FAILED'}")
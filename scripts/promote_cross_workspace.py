@@ -56,6 +56,8 @@ Environment Variables (can also be set in .env file):
     GCP_PROJECT_ID: GCP project ID (default: zenml-core)
 """
 
+import functools
+import hashlib
 import json
 import os
 import sys
@@ -64,21 +66,28 @@ from pathlib import Path
 # Add project root to Python path for imports
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
-import subprocess
 import tempfile
+import types
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
-import joblib
 from dotenv import load_dotenv
-from google.cloud import storage
 from zenml import log_metadata
 from zenml.client import Client
 from zenml.enums import ModelStages
 from zenml.logger import get_logger
 
+if TYPE_CHECKING:
+    from google.cloud import storage
+
+try:
+    import orjson
+except ImportError:  # Optional accelerator; stdlib json is used otherwise
+    orjson = None
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -97,72 +106,215 @@ USE_SHARED_ARTIFACT_STORE = (
     os.getenv("USE_SHARED_ARTIFACT_STORE", "false").lower() == "true"
 )
 
-WORKSPACE_CONFIG = {
-    "enterprise-dev-staging": {
-        "url_env": "ZENML_DEV_STAGING_URL",
-        "api_key_env": "ZENML_DEV_STAGING_API_KEY",
-        "project": os.getenv("ZENML_PROJECT", "cancer-detection"),
-    },
-    "enterprise-production": {
-        "url_env": "ZENML_PRODUCTION_URL",
-        "api_key_env": "ZENML_PRODUCTION_API_KEY",
-        "project": os.getenv("ZENML_PROJECT", "cancer-detection"),
-    },
-}
+# Whether we're running under CI (controls the GitHub Actions export_path.txt)
+IN_CI = bool(os.getenv("CI") or os.getenv("GITHUB_ACTIONS"))
+
+# Buffer size for local artifact/output writes (one syscall per MiB)
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Exported artifacts are upload-bound, so trade a little CPU for fewer bytes.
+# zlib level 3 needs no extra dependency; protocol 5 avoids copying numpy buffers.
+# joblib.load() detects the compression on import, so readers need no changes.
+JOBLIB_COMPRESS = 3
+JOBLIB_PROTOCOL = 5
+
+# Resumable upload chunk size for streamed GCS writes (must be a multiple of 256 KiB)
+GCS_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Local copies of downloaded manifests, so re-importing the same export
+# (retries, staging-then-production) skips the GCS download
+_MANIFEST_CACHE_DIR = Path.home() / ".cache" / "zenml_promote"
+
+DEFAULT_PROJECT = os.getenv("ZENML_PROJECT", "cancer-detection")
+
+WORKSPACE_CONFIG = types.MappingProxyType(
+    {
+        "enterprise-dev-staging": types.SimpleNamespace(
+            url_env="ZENML_DEV_STAGING_URL",
+            api_key_env="ZENML_DEV_STAGING_API_KEY",
+            project=DEFAULT_PROJECT,
+        ),
+        "enterprise-production": types.SimpleNamespace(
+            url_env="ZENML_PRODUCTION_URL",
+            api_key_env="ZENML_PRODUCTION_API_KEY",
+            project=DEFAULT_PROJECT,
+        ),
+    }
+)
+
+# Metadata value types exported as metrics in the manifest
+_METRIC_TYPES = (int, float, str, bool)
+
+# --source-stage values that map to a ModelStages alias (others are versions)
+_STAGE_MAP = types.MappingProxyType(
+    {
+        "staging": ModelStages.STAGING,
+        "production": ModelStages.PRODUCTION,
+        "latest": ModelStages.LATEST,
+    }
+)
+
+
+def _dump_manifest(manifest: dict) -> bytes:
+    """Serialize a manifest to indented UTF-8 JSON (orjson if installed)."""
+    if orjson is not None:
+        return orjson.dumps(manifest, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(manifest, indent=2, default=str).encode("utf-8")
+
+
+def _load_manifest_bytes(data: bytes) -> dict:
+    """Parse manifest JSON bytes (orjson if installed)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
-def _upload_to_gcs(local_path: str, gcs_uri: str, bucket_name: str) -> None:
-    """Upload a file to GCS.
+@functools.cache
+def _joblib():
+    """Import joblib on first use (it pulls in numpy, ~hundreds of ms)."""
+    import joblib
+
+    return joblib
+
+
+@functools.cache
+def _storage():
+    """Import google.cloud.storage on first use (unused in shared-store mode)."""
+    from google.cloud import storage
+
+    return storage
+
+
+@functools.cache
+def _gcs_bucket(bucket_name: str) -> "storage.Bucket":
+    """Return a cached bucket handle for the direct GCS client path.
+
+    Reusing one client keeps credentials, the HTTP session and its connection
+    pool alive across all uploads and downloads in a promotion.
+    Uses user_project for requester pays buckets.
+    """
+    client = _storage().Client(project=DEFAULT_GCP_PROJECT)
+    return client.bucket(bucket_name, user_project=DEFAULT_GCP_PROJECT)
+
+
+def _open_gcs_writer(
+    gcs_uri: str, bucket_name: str, content_type: Optional[str] = None
+):
+    """Open a GCS object for streaming binary writes.
 
     Uses ZenML's fileio when using shared artifact store (recommended),
     otherwise uses direct GCS client for separate bucket architecture.
+    Serializers can write straight into the returned file object, so no
+    local temp file is needed.
 
     Args:
-        local_path: Path to local file
         gcs_uri: Full GCS URI (gs://bucket/path)
         bucket_name: GCS bucket name
+        content_type: Content type for the object (direct GCS client only)
+
+    Returns:
+        Writable binary file object; the upload completes when it is closed
     """
     if USE_SHARED_ARTIFACT_STORE:
         # Shared artifact store: fileio works because bucket is within bounds
         from zenml.io import fileio
 
-        fileio.copy(local_path, gcs_uri, overwrite=True)
-    else:
-        # Separate buckets: use direct GCS client to bypass bounds validation
-        # Use user_project for requester pays buckets
-        gcp_project = os.getenv("GCP_PROJECT_ID", DEFAULT_GCP_PROJECT)
-        client = storage.Client(project=gcp_project)
-        bucket = client.bucket(bucket_name, user_project=gcp_project)
-        blob_path = gcs_uri.replace(f"gs://{bucket_name}/", "")
-        blob = bucket.blob(blob_path)
-        blob.upload_from_filename(local_path)
+        return fileio.open(gcs_uri, "wb")
+
+    # Separate buckets: use direct GCS client to bypass bounds validation
+    blob_path = gcs_uri.replace(f"gs://{bucket_name}/", "")
+    blob = _gcs_bucket(bucket_name).blob(blob_path)
+    # ignore_flush: pickle/joblib call flush(), which resumable uploads reject
+    return blob.open(
+        "wb",
+        chunk_size=GCS_CHUNK_SIZE,
+        ignore_flush=True,
+        content_type=content_type,
+    )
+
+
+def _dump_to_gcs(obj, gcs_uri: str, bucket_name: str) -> str:
+    """Serialize an object with joblib straight into a GCS object.
+
+    Args:
+        obj: Object to serialize
+        gcs_uri: Full GCS URI (gs://bucket/path)
+        bucket_name: GCS bucket name
 
+    Returns:
+        The GCS URI that was written
+    """
+    with _open_gcs_writer(gcs_uri, bucket_name) as f:
+        _joblib().dump(obj, f, compress=JOBLIB_COMPRESS, protocol=JOBLIB_PROTOCOL)
+    return gcs_uri
 
-def _download_from_gcs(gcs_uri: str, local_path: str, bucket_name: str) -> None:
-    """Download a file from GCS.
+
+def _read_from_gcs(gcs_uri: str, bucket_name: str) -> bytes:
+    """Read a file from GCS into memory.
 
     Uses ZenML's fileio when using shared artifact store (recommended),
     otherwise uses direct GCS client for separate bucket architecture.
 
     Args:
         gcs_uri: Full GCS URI (gs://bucket/path)
-        local_path: Path to save locally
         bucket_name: GCS bucket name
+
+    Returns:
+        The file contents
     """
     if USE_SHARED_ARTIFACT_STORE:
         # Shared artifact store: fileio works because bucket is within bounds
         from zenml.io import fileio
 
-        fileio.copy(gcs_uri, local_path, overwrite=True)
+        with fileio.open(gcs_uri, "rb") as f:
+            return f.read()
     else:
         # Separate buckets: use direct GCS client to bypass bounds validation
-        # Use user_project for requester pays buckets
-        gcp_project = os.getenv("GCP_PROJECT_ID", DEFAULT_GCP_PROJECT)
-        client = storage.Client(project=gcp_project)
-        bucket = client.bucket(bucket_name, user_project=gcp_project)
         blob_path = gcs_uri.replace(f"gs://{bucket_name}/", "")
-        blob = bucket.blob(blob_path)
-        blob.download_to_filename(local_path)
+        return _gcs_bucket(bucket_name).blob(blob_path).download_as_bytes()
+
+
+def _read_manifest_cached(manifest_uri: str, bucket_name: str) -> bytes:
+    """Read a manifest, reusing the local cache while the GCS object is unchanged.
+
+    Only the direct GCS client path is cached, since it exposes the object's
+    update time through a cheap metadata request. Cache writes are best effort.
+
+    Args:
+        manifest_uri: Full GCS URI of manifest.json
+        bucket_name: GCS bucket name
+
+    Returns:
+        The manifest JSON bytes
+    """
+    if USE_SHARED_ARTIFACT_STORE:
+        return _read_from_gcs(manifest_uri, bucket_name)
+
+    cache_path = (
+        _MANIFEST_CACHE_DIR / hashlib.sha256(manifest_uri.encode()).hexdigest()
+    )
+    blob_path = manifest_uri.replace(f"gs://{bucket_name}/", "")
+    blob = _gcs_bucket(bucket_name).blob(blob_path)
+    blob.reload()  # Metadata only; populates blob.updated
+
+    try:
+        if blob.updated.timestamp() <= cache_path.stat().st_mtime:
+            logger.info(f"Using cached manifest for {manifest_uri}")
+            return cache_path.read_bytes()
+    except OSError:
+        pass
+
+    data = blob.download_as_bytes()
+    try:
+        _MANIFEST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=_MANIFEST_CACHE_DIR, delete=False, suffix=".tmp"
+        ) as f:
+            f.write(data)
+        Path(f.name).replace(cache_path)
+    except OSError as e:
+        logger.warning(f"Could not cache manifest: {e}")
+    return data
 
 
 def _validate_manifest(manifest: dict) -> None:
@@ -195,6 +347,31 @@ def _validate_manifest(manifest: dict) -> None:
         raise ValueError("Invalid manifest: missing artifacts.model field")
 
 
+def _load_manifest(manifest_path: str, exchange_bucket: str) -> dict:
+    """Download and validate an export manifest.
+
+    Args:
+        manifest_path: GCS URI, bucket-relative path, or export directory
+        exchange_bucket: GCS bucket name
+
+    Returns:
+        The validated manifest dictionary
+    """
+    # Normalize manifest path
+    if not manifest_path.startswith("gs://"):
+        manifest_path = f"gs://{exchange_bucket}/{manifest_path}"
+    if not manifest_path.endswith("/manifest.json"):
+        manifest_path = f"{manifest_path}/manifest.json"
+
+    manifest = _load_manifest_bytes(
+        _read_manifest_cached(manifest_path, exchange_bucket)
+    )
+
+    # Validate manifest schema
+    _validate_manifest(manifest)
+    return manifest
+
+
 def connect_to_workspace(workspace_name: str) -> Client:
     """Connect to a ZenML workspace by setting environment variables.
 
@@ -211,16 +388,16 @@ def connect_to_workspace(workspace_name: str) -> Client:
     if not config:
         raise ValueError(f"Unknown workspace: {workspace_name}")
 
-    url = os.environ.get(config["url_env"])
-    api_key = os.environ.get(config["api_key_env"])
+    url = os.environ.get(config.url_env)
+    api_key = os.environ.get(config.api_key_env)
 
     if not url:
         raise ValueError(
-            f"Store URL not found. Set {config['url_env']} environment variable."
+            f"Store URL not found. Set {config.url_env} environment variable."
         )
     if not api_key:
         raise ValueError(
-            f"API key not found. Set {config['api_key_env']} environment variable."
+            f"API key not found. Set {config.api_key_env} environment variable."
         )
 
     logger.info(f"Connecting to workspace: {workspace_name}")
@@ -239,16 +416,14 @@ def connect_to_workspace(workspace_name: str) -> Client:
     gc = GlobalConfiguration()
     gc._zen_store = None
 
-    # Set project
-    result = subprocess.run(
-        ["zenml", "project", "set", config["project"]],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        raise RuntimeError(f"Failed to set project: {result.stderr}")
+    # Set project in-process (no `zenml project set` subprocess)
+    client = Client()
+    try:
+        client.set_active_project(config.project)
+    except KeyError as e:
+        raise RuntimeError(f"Failed to set project: {e}") from e
 
-    return Client()
+    return client
 
 
 def export_model(
@@ -272,17 +447,10 @@ def export_model(
     """
     logger.info(f"Exporting {model_name} ({source_stage}) from {source_workspace}")
 
-    # Map stage string to enum
-    stage_map = {
-        "staging": ModelStages.STAGING,
-        "production": ModelStages.PRODUCTION,
-        "latest": ModelStages.LATEST,
-    }
-
     # Get model version
     model_version = client.get_model_version(
         model_name_or_id=model_name,
-        model_version_name_or_number_or_id=stage_map.get(source_stage, source_stage),
+        model_version_name_or_number_or_id=_STAGE_MAP.get(source_stage, source_stage),
     )
 
     logger.info(f"Found model version: {model_version.number}")
@@ -297,24 +465,29 @@ def export_model(
     model = model_artifact.load()
     scaler = scaler_artifact.load() if scaler_artifact else None
 
-    # Extract metrics and existing promotion_chain from metadata
-    metrics = {}
+    # Extract metrics from metadata. Current ZenML returns raw values, so the
+    # isinstance check short-circuits before the (slower) hasattr fallback for
+    # older MetadataValue-style wrappers.
+    run_metadata = model_version.run_metadata or {}
+    metrics = {
+        key: value if isinstance(value, _METRIC_TYPES) else value.value
+        for key, value in run_metadata.items()
+        if key != "promotion_chain"
+        and (isinstance(value, _METRIC_TYPES) or hasattr(value, "value"))
+    }
+
+    # Preserve existing promotion history
     existing_chain = []
-    for key, value in (model_version.run_metadata or {}).items():
-        if key == "promotion_chain":
-            # Preserve existing promotion history
-            chain_value = value.value if hasattr(value, "value") else value
-            if isinstance(chain_value, str):
-                existing_chain = json.loads(chain_value)
-            elif isinstance(chain_value, list):
-                existing_chain = chain_value
-        elif hasattr(value, "value"):
-            metrics[key] = value.value
-        elif isinstance(value, (int, float, str, bool)):
-            metrics[key] = value
+    chain_value = run_metadata.get("promotion_chain")
+    if hasattr(chain_value, "value"):
+        chain_value = chain_value.value
+    if isinstance(chain_value, str):
+        existing_chain = json.loads(chain_value)
+    elif isinstance(chain_value, list):
+        existing_chain = chain_value
 
     # Get project for URL construction
-    project = WORKSPACE_CONFIG[source_workspace]["project"]
+    project = WORKSPACE_CONFIG[source_workspace].project
 
     # Build model version URL
     model_version_url = (
@@ -334,13 +507,18 @@ def export_model(
             f"projects/{project}/runs/{first_run_id}?tab=overview"
         )
 
-    # Create export manifest
-    timestamp = datetime.now(tz=timezone.utc).strftime("%Y-%m-%dT%H-%M-%S")
-    export_path = f"exports/{model_name}/{source_workspace}_to_production/{timestamp}"
+    # Create export manifest. One clock read so the export path, manifest
+    # timestamp and promotion-chain entry all agree exactly.
+    now = datetime.now(tz=timezone.utc)
+    now_iso = now.isoformat()
+    export_path = (
+        f"exports/{model_name}/{source_workspace}_to_production/"
+        f"{now.strftime('%Y-%m-%dT%H-%M-%S')}"
+    )
 
     manifest = {
         "model_name": model_name,
-        "export_timestamp": datetime.now(tz=timezone.utc).isoformat(),
+        "export_timestamp": now_iso,
         "export_path": f"gs://{exchange_bucket}/{export_path}",
         # Source information
         "source": {
@@ -371,7 +549,7 @@ def export_model(
                 "from_stage": source_stage,
                 "from_version": model_version.number,
                 "model_version_url": model_version_url,
-                "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+                "timestamp": now_iso,
             }
         ],
     }
@@ -380,48 +558,30 @@ def export_model(
     # The model exchange bucket is intentionally separate from the artifact store
     export_uri = f"gs://{exchange_bucket}/{export_path}"
 
-    # Upload model artifact
-    model_uri = f"{export_uri}/model.joblib"
-    with tempfile.NamedTemporaryFile(suffix=".joblib", delete=False) as f:
-        tmp_model_path = f.name
-    try:
-        joblib.dump(model, tmp_model_path)
-        _upload_to_gcs(tmp_model_path, model_uri, exchange_bucket)
-        logger.info(f"Uploaded model to {model_uri}")
-    finally:
-        if os.path.exists(tmp_model_path):
-            os.unlink(tmp_model_path)
-
-    # Upload scaler if exists
+    # Upload model and scaler concurrently; the GCS client releases the GIL
+    # during HTTP requests, so wall-clock is the slowest upload, not the sum
+    artifacts = {f"{export_uri}/model.joblib": model}
     if scaler is not None:
-        scaler_uri = f"{export_uri}/scaler.joblib"
-        with tempfile.NamedTemporaryFile(suffix=".joblib", delete=False) as f:
-            tmp_scaler_path = f.name
-        try:
-            joblib.dump(scaler, tmp_scaler_path)
-            _upload_to_gcs(tmp_scaler_path, scaler_uri, exchange_bucket)
-            logger.info(f"Uploaded scaler to {scaler_uri}")
-        finally:
-            if os.path.exists(tmp_scaler_path):
-                os.unlink(tmp_scaler_path)
-
-    # Upload manifest
+        artifacts[f"{export_uri}/scaler.joblib"] = scaler
+
+    with ThreadPoolExecutor(max_workers=len(artifacts)) as executor:
+        futures = [
+            executor.submit(_dump_to_gcs, obj, uri, exchange_bucket)
+            for uri, obj in artifacts.items()
+        ]
+        for future in futures:
+            logger.info(f"Uploaded {future.result()}")
+
+    # Upload manifest last so it only exists once all artifacts are complete
     manifest_uri = f"{export_uri}/manifest.json"
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        tmp_manifest_path = f.name
-        json.dump(manifest, f, indent=2, default=str)
-        f.flush()
-    try:
-        _upload_to_gcs(tmp_manifest_path, manifest_uri, exchange_bucket)
-        logger.info(f"Uploaded manifest to {manifest_uri}")
-    finally:
-        if os.path.exists(tmp_manifest_path):
-            os.unlink(tmp_manifest_path)
+    with _open_gcs_writer(manifest_uri, exchange_bucket, "application/json") as f:
+        f.write(_dump_manifest(manifest))
+    logger.info(f"Uploaded manifest to {manifest_uri}")
 
     # Write export path to file for GitHub Actions (only in CI environment)
-    if os.environ.get("CI") or os.environ.get("GITHUB_ACTIONS"):
-        with open("export_path.txt", "w") as f:
-            f.write(f"gs://{exchange_bucket}/{export_path}")
+    if IN_CI:
+        with open("export_path.txt", "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(f"gs://{exchange_bucket}/{export_path}".encode())
 
     return manifest
 
@@ -480,6 +640,7 @@ def import_model(
     dest_workspace: str,
     dest_stage: str,
     exchange_bucket: str,
+    manifest: Optional[dict] = None,
 ) -> str:
     """Import model artifacts into destination workspace.
 
@@ -489,6 +650,7 @@ def import_model(
         dest_workspace: Name of destination workspace
         dest_stage: Target stage in destination workspace
         exchange_bucket: GCS bucket name
+        manifest: Already-loaded manifest; skips re-downloading manifest_path
 
     Returns:
         New model version ID in destination workspace
@@ -496,40 +658,29 @@ def import_model(
     logger.info(f"Importing model into {dest_workspace}")
 
     # Load manifest directly from GCS (bypasses artifact store bounds)
-    # Normalize manifest path
-    if not manifest_path.startswith("gs://"):
-        manifest_path = f"gs://{exchange_bucket}/{manifest_path}"
-    if not manifest_path.endswith("/manifest.json"):
-        manifest_path = f"{manifest_path}/manifest.json"
-
-    # Download manifest to temp file and read
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp:
-        tmp_path = tmp.name
-    try:
-        _download_from_gcs(manifest_path, tmp_path, exchange_bucket)
-        with open(tmp_path) as f:
-            manifest = json.load(f)
-    finally:
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
-
-    # Validate manifest schema
-    _validate_manifest(manifest)
+    if manifest is None:
+        manifest = _load_manifest(manifest_path, exchange_bucket)
+    else:
+        _validate_manifest(manifest)
 
     logger.info(f"Loaded manifest for {manifest['model_name']}")
     logger.info(
         f"Source: {manifest['source']['workspace']} v{manifest['source']['model_version']}"
     )
 
-    # Add import entry to promotion chain
-    manifest["promotion_chain"].append(
-        {
-            "action": "imported",
-            "to_workspace": dest_workspace,
-            "to_stage": dest_stage,
-            "timestamp": datetime.now(tz=timezone.utc).isoformat(),
-        }
-    )
+    # Add import entry to promotion chain (without mutating the caller's copy)
+    manifest = {
+        **manifest,
+        "promotion_chain": [
+            *manifest["promotion_chain"],
+            {
+                "action": "imported",
+                "to_workspace": dest_workspace,
+                "to_stage": dest_stage,
+                "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+            },
+        ],
+    }
 
     # Run import pipeline (steps download artifacts from GCS directly)
     logger.info("Running import pipeline...")
@@ -652,9 +803,7 @@ def promote_cross_workspace(
             --dest-workspace enterprise-production \\
             --import-from gs://zenml-core-model-exchange/exports/...
     """
-    bucket = exchange_bucket or os.environ.get(
-        "MODEL_EXCHANGE_BUCKET", DEFAULT_EXCHANGE_BUCKET
-    )
+    bucket = exchange_bucket or DEFAULT_EXCHANGE_BUCKET
 
     logger.info("=" * 60)
     logger.info("Cross-Workspace Model Promotion")
@@ -696,27 +845,7 @@ def promote_cross_workspace(
     else:
         # Load manifest for import-only workflow directly from GCS
         logger.info(f"Import from: {import_from}")
-
-        # Normalize manifest path
-        manifest_path = import_from
-        if not manifest_path.startswith("gs://"):
-            manifest_path = f"gs://{bucket}/{manifest_path}"
-        if not manifest_path.endswith("/manifest.json"):
-            manifest_path = f"{manifest_path}/manifest.json"
-
-        # Download manifest to temp file and read
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp:
-            tmp_path = tmp.name
-        try:
-            _download_from_gcs(manifest_path, tmp_path, bucket)
-            with open(tmp_path) as f:
-                manifest = json.load(f)
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
-
-        # Validate manifest schema
-        _validate_manifest(manifest)
+        manifest = _load_manifest(import_from, bucket)
 
     # Validation phase
     if dest_workspace and not skip_validation:
@@ -740,6 +869,7 @@ def promote_cross_workspace(
             dest_workspace=dest_workspace,
             dest_stage=dest_stage,
             exchange_bucket=bucket,
+            manifest=manifest,  # Already in memory from export or import-from
         )
 
         # Update source model with promotion metadata (bidirectional link)
@@ -748,7 +878,7 @@ def promote_cross_workspace(
             source_client = connect_to_workspace(source_workspace)
 
             # Get the project for URL construction
-            project = WORKSPACE_CONFIG[dest_workspace]["project"]
+            project = WORKSPACE_CONFIG[dest_workspace].project
             dest_model_url = (
                 f"https://cloud.zenml.io/workspaces/{dest_workspace}/"
                 f"projects/{project}/model-versions/{new_version_id}?tab=overview"
@@ -43,6 +43,8 @@ Usage:
     python scripts/promote_model.py --model breast_cancer_classifier --from-stage staging --to-stage production
 """
 
+import functools
+import types
 from datetime import datetime, timezone
 
 import click
@@ -54,6 +56,102 @@ from zenml.models import ModelVersionResponse
 
 logger = get_logger(__name__)
 
+# --from-stage / --to-stage choices mapped to ModelStages
+_FROM_STAGE_MAP = types.MappingProxyType(
+    {
+        "staging": ModelStages.STAGING,
+        "production": ModelStages.PRODUCTION,
+        "latest": ModelStages.LATEST,
+    }
+)
+_TO_STAGE_MAP = types.MappingProxyType(
+    {
+        "staging": ModelStages.STAGING,
+        "production": ModelStages.PRODUCTION,
+        "archived": ModelStages.ARCHIVED,
+    }
+)
+
+# Metrics every promotable model version must have logged
+REQUIRED_METRICS = frozenset(("accuracy", "precision", "recall"))
+
+# Minimum metric values per target stage
+PROMOTION_REQUIREMENTS = types.MappingProxyType(
+    {
+        "staging": types.MappingProxyType(
+            {
+                "accuracy": 0.7,
+                "precision": 0.7,
+                "recall": 0.7,
+            }
+        ),
+        "production": types.MappingProxyType(
+            {
+                "accuracy": 0.8,
+                "precision": 0.8,
+                "recall": 0.8,
+            }
+        ),
+    }
+)
+
+
+def _metric_value(metric) -> float:
+    """Return a metric as a float, unwrapping MetadataValue-style objects."""
+    try:
+        return float(metric.value)
+    except AttributeError:
+        return float(metric)
+
+
+@functools.cache
+def _client() -> Client:
+    """Return the process-wide ZenML client."""
+    return Client()
+
+
+@functools.lru_cache(maxsize=64)
+def _get_model_version(
+    model_name: str, version: "str | ModelStages"
+) -> "ModelVersionResponse":
+    """Resolve a model version once per CLI run.
+
+    The same (model, version-or-stage) pair is looked up more than once during
+    a promotion (e.g. --from-stage matching the target stage). Call
+    ``_get_model_version.cache_clear()`` after changing a stage.
+    """
+    return _client().get_model_version(model_name, version)
+
+
+def _iter_versions_newest_first(
+    client: Client, model_name: str, page_size: int = 5, max_versions: int = 20
+):
+    """Yield a model's versions newest first, fetching pages only as needed.
+
+    Sorting happens server-side, so the usual case (a recent version has
+    metrics) costs one small page instead of a full listing. Pages are
+    requested hydrated so reading ``run_metadata`` doesn't lazily re-fetch
+    each version.
+    """
+    page = 1
+    seen = 0
+    while seen < max_versions:
+        versions = client.list_model_versions(
+            model=model_name,
+            sort_by="desc:number",
+            page=page,
+            size=page_size,
+            hydrate=True,
+        )
+        for version in versions.items:
+            yield version
+            seen += 1
+            if seen >= max_versions:
+                return
+        if page >= versions.total_pages:
+            return
+        page += 1
+
 
 def find_latest_with_metrics(
     client: Client, model_name: str, prefer_environment: str | None = "staging"
@@ -76,37 +174,35 @@ def find_latest_with_metrics(
     Raises:
         ValueError: If no version with metrics is found
     """
-    required_metrics = ["accuracy", "precision", "recall"]
-    versions = client.list_model_versions(model=model_name, size=20)
-
-    # Sort by version number descending to get latest first
-    sorted_versions = sorted(versions, key=lambda v: v.number, reverse=True)
-
-    # First pass: find staging-trained models (if prefer_environment is set)
-    if prefer_environment:
-        for version in sorted_versions:
-            metrics = version.run_metadata
-            if not metrics or not all(m in metrics for m in required_metrics):
-                continue
-            env_meta = metrics.get("environment")
-            if env_meta:
-                env_value = env_meta.value if hasattr(env_meta, "value") else env_meta
-                if env_value == prefer_environment:
-                    logger.info(
-                        f"Found version {version.number} with metrics "
-                        f"and environment={prefer_environment}"
-                    )
-                    return version
-
-    # Second pass: fall back to any model with metrics
-    for version in sorted_versions:
+    fallback = None
+    for version in _iter_versions_newest_first(client, model_name):
         metrics = version.run_metadata
-        if metrics and all(m in metrics for m in required_metrics):
-            logger.info(f"Found version {version.number} with metrics (fallback)")
+        if not metrics or not REQUIRED_METRICS.issubset(metrics.keys()):
+            continue
+        if not prefer_environment:
+            logger.info(f"Found version {version.number} with metrics")
             return version
 
+        # Prefer staging-trained models; remember the newest one with
+        # metrics in case none match the preferred environment
+        env_meta = metrics.get("environment")
+        if env_meta:
+            env_value = env_meta.value if hasattr(env_meta, "value") else env_meta
+            if env_value == prefer_environment:
+                logger.info(
+                    f"Found version {version.number} with metrics "
+                    f"and environment={prefer_environment}"
+                )
+                return version
+        if fallback is None:
+            fallback = version
+
+    if fallback is not None:
+        logger.info(f"Found version {fallback.number} with metrics (fallback)")
+        return fallback
+
     raise ValueError(
-        f"No model version found with required metrics: {required_metrics}. "
+        f"No model version found with required metrics: {sorted(REQUIRED_METRICS)}. "
         f"Run the training pipeline first."
     )
 
@@ -128,8 +224,7 @@ def validate_promotion(model_version, to_stage: str) -> bool:
     metrics = model_version.run_metadata
 
     # Check if required metrics exist
-    required_metrics = ["accuracy", "precision", "recall"]
-    missing_metrics = [m for m in required_metrics if m not in metrics]
+    missing_metrics = sorted(REQUIRED_METRICS - metrics.keys())
 
     if missing_metrics:
         raise ValueError(
@@ -137,32 +232,14 @@ def validate_promotion(model_version, to_stage: str) -> bool:
             f"{missing_metrics}"
         )
 
-    # Define minimum requirements per stage
-    requirements = {
-        "staging": {
-            "accuracy": 0.7,
-            "precision": 0.7,
-            "recall": 0.7,
-        },
-        "production": {
-            "accuracy": 0.8,
-            "precision": 0.8,
-            "recall": 0.8,
-        },
-    }
-
-    stage_requirements = requirements.get(to_stage, {})
+    # Unwrap the required metrics once, then compare against the thresholds
+    values = {metric: _metric_value(metrics[metric]) for metric in REQUIRED_METRICS}
+    stage_requirements = PROMOTION_REQUIREMENTS.get(to_stage, {})
 
     # Validate metrics
     failures = []
     for metric, min_value in stage_requirements.items():
-        # Metrics are already stored as metadata values
-        metric_obj = metrics.get(metric)
-        actual_value = (
-            float(metric_obj.value)
-            if hasattr(metric_obj, "value")
-            else float(metric_obj)
-        )
+        actual_value = values[metric]
         if actual_value < min_value:
             failures.append(
                 f"{metric}: {actual_value:.3f} < {min_value:.3f} (required)"
@@ -237,32 +314,26 @@ def promote_model(
     environments (e.g., staging -> production) with proper validation
     and audit logging.
     """
-    client = Client()
+    client = _client()
 
-    logger.info("🚀 Model Promotion Script")
-    logger.info(f"Model: {model}")
-    logger.info(f"Target stage: {to_stage}")
+    logger.info(f"🚀 Model Promotion Script\nModel: {model}\nTarget stage: {to_stage}")
 
     try:
         # Determine which version to promote
         if version:
             logger.info(f"Promoting specific version: {version}")
-            model_version = client.get_model_version(model, version)
+            model_version = _get_model_version(model, version)
         elif from_stage:
             logger.info(f"Promoting from stage: {from_stage}")
-            # Map string stage to ModelStages enum
-            stage_map = {
-                "staging": ModelStages.STAGING,
-                "production": ModelStages.PRODUCTION,
-                "latest": ModelStages.LATEST,
-            }
-            model_version = client.get_model_version(model, stage_map[from_stage])
+            model_version = _get_model_version(model, _FROM_STAGE_MAP[from_stage])
         else:
             logger.info("Finding latest version with metrics...")
             model_version = find_latest_with_metrics(client, model)
 
-        logger.info(f"Model version: {model_version.number}")
-        logger.info(f"Current stage: {model_version.stage}")
+        logger.info(
+            f"Model version: {model_version.number}\n"
+            f"Current stage: {model_version.stage}"
+        )
 
         # Validate promotion (unless skipped)
         if not skip_validation:
@@ -271,40 +342,34 @@ def promote_model(
         else:
             logger.warning("⚠️  Skipping validation checks (--skip-validation)")
 
-        # Check if another model is in target stage
-        try:
-            current_model_in_stage = client.get_model_version(
-                model,
-                ModelStages.STAGING
-                if to_stage == "staging"
-                else ModelStages.PRODUCTION,
-            )
-            if current_model_in_stage.number != model_version.number:
-                if not force:
+        # Check if another model is in target stage. With --force, set_stage()
+        # demotes any occupant server-side, so skip the extra registry lookup.
+        if force:
+            logger.warning(f"--force: any version currently in {to_stage} is demoted")
+        else:
+            try:
+                current_model_in_stage = _get_model_version(
+                    model,
+                    ModelStages.STAGING
+                    if to_stage == "staging"
+                    else ModelStages.PRODUCTION,
+                )
+                if current_model_in_stage.number != model_version.number:
                     logger.error(
                         f"Model version {current_model_in_stage.number} is already in {to_stage}. "
                         f"Use --force to demote it."
                     )
                     raise ValueError(f"Another model is already in {to_stage} stage")
-                else:
-                    logger.warning(
-                        f"Demoting version {current_model_in_stage.number} from {to_stage}"
-                    )
-        except KeyError:
-            # No model in target stage, proceed
-            pass
+            except KeyError:
+                # No model in target stage, proceed
+                pass
 
         # Perform promotion
         logger.info(f"Promoting model to {to_stage}...")
 
-        # Map string stage to ModelStages enum
-        stage_map = {
-            "staging": ModelStages.STAGING,
-            "production": ModelStages.PRODUCTION,
-            "archived": ModelStages.ARCHIVED,
-        }
-
-        model_version.set_stage(stage=stage_map[to_stage], force=force)
+        model_version.set_stage(stage=_TO_STAGE_MAP[to_stage], force=force)
+        # Stage assignments just changed
+        _get_model_version.cache_clear()
 
         # Get project for audit trail URLs
         project_name = client.active_project.name
@@ -323,9 +388,13 @@ def promote_model(
 
         # Log promotion event to promotion_chain for full audit trail
         # This tracks: none → staging → (later: exported → imported to production)
+        # Re-read the version so entries logged since it was fetched are kept
         existing_chain = []
-        if "promotion_chain" in model_version.run_metadata:
-            chain_meta = model_version.run_metadata["promotion_chain"]
+        run_metadata = client.get_model_version(
+            model, model_version.number
+        ).run_metadata
+        if "promotion_chain" in run_metadata:
+            chain_meta = run_metadata["promotion_chain"]
             existing_chain = chain_meta.value if hasattr(chain_meta, "value") else chain_meta
             if isinstance(existing_chain, str):
                 import json
@@ -355,14 +424,10 @@ def promote_model(
         )
 
         logger.info(
-            f"✅ Successfully promoted {model} v{model_version.number} to {to_stage}!"
+            f"✅ Successfully promoted {model} v{model_version.number} to {to_stage}!\n"
+            f"Dashboard: https://cloud.zenml.io/workspaces/{workspace}/projects/{project_name}/model-versions/{model_version.id}?tab=overview\n"
+            f"📋 Promotion logged to audit trail (promotion_chain: {len(updated_chain)} entries)"
         )
-        logger.info(
-            f"Dashboard: https://cloud.zenml.io/workspaces/{workspace}/projects/{project_name}/model-versions/{model_version.id}?tab=overview"
-        )
-
-        # Log promotion event for audit trail
-        logger.info(f"📋 Promotion logged to audit trail (promotion_chain: {len(updated_chain)} entries)")
 
     except Exception as e:
         logger.error(f"❌ Promotion failed: {e!s}")
@@ -33,6 +33,8 @@ Usage:
     python scripts/rollback_model.py --model breast_cancer_classifier --dry-run
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import click
 from zenml.client import Client
 from zenml.enums import ModelStages
@@ -43,19 +45,23 @@ logger = get_logger(__name__)
 MODEL_NAME = "breast_cancer_classifier"
 
 
-def get_previous_production_version(
-    client: Client, model_name: str, current_version: int
-):
+def list_versions_newest_first(client: Client, model_name: str):
+    """List a model's versions, highest version number first."""
+    return client.list_model_versions(
+        model_name_or_id=model_name, sort_by="desc:number"
+    )
+
+
+def get_previous_production_version(versions, current_version: int):
     """Find the most recent version that was previously in production.
 
     Searches through model versions to find the one that was in production
     before the current one, based on version number and metadata.
-    """
-    model = client.get_model(model_name)
-    versions = client.list_model_versions(
-        model_name_or_id=model.id, sort_by="desc:number"
-    )
 
+    Args:
+        versions: Model versions sorted by descending version number
+        current_version: Version number currently in production
+    """
     # Find versions that are archived (previously promoted) or have production history
     for mv in versions:
         if mv.number < current_version:
@@ -112,16 +118,32 @@ def rollback_model(
     """
     client = Client()
 
-    logger.info("🔄 Model Rollback Script")
-    logger.info(f"Model: {model}")
+    logger.info(f"🔄 Model Rollback Script\nModel: {model}")
 
     if dry_run:
         logger.info("🔍 DRY RUN MODE - No changes will be made")
 
     try:
+        # The current production version and the rollback candidates are
+        # independent registry reads, so fetch them concurrently. Connect the
+        # store first so the workers don't race on its lazy initialization.
+        client.zen_store  # noqa: B018
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            current_future = executor.submit(
+                client.get_model_version, model, ModelStages.PRODUCTION
+            )
+            if to_version:
+                target_future = executor.submit(
+                    client.get_model_version, model, to_version
+                )
+            else:
+                target_future = executor.submit(
+                    list_versions_newest_first, client, model
+                )
+
         # Get current production model
         try:
-            current_prod = client.get_model_version(model, ModelStages.PRODUCTION)
+            current_prod = current_future.result()
             logger.info(f"Current production: v{current_prod.number}")
         except KeyError:
             logger.error("No model currently in production. Nothing to rollback.")
@@ -130,11 +152,11 @@ def rollback_model(
         # Determine rollback target
         if to_version:
             logger.info(f"Rolling back to specified version: v{to_version}")
-            rollback_target = client.get_model_version(model, to_version)
+            rollback_target = target_future.result()
         else:
             logger.info("Finding previous production version...")
             rollback_target = get_previous_production_version(
-                client, model, current_prod.number
+                target_future.result(), current_prod.number
             )
 
             if rollback_target is None:
@@ -152,13 +174,16 @@ def rollback_model(
             raise click.Abort()
 
         # Show rollback plan
-        logger.info("")
-        logger.info("📋 Rollback Plan:")
-        logger.info(f"  1. Promote v{rollback_target.number} to production")
-        logger.info(f"  2. Demote v{current_prod.number} from production → archived")
+        plan = [
+            "",
+            "📋 Rollback Plan:",
+            f"  1. Promote v{rollback_target.number} to production",
+            f"  2. Demote v{current_prod.number} from production → archived",
+        ]
         if reason:
-            logger.info(f"  Reason: {reason}")
-        logger.info("")
+            plan.append(f"  Reason: {reason}")
+        plan.append("")
+        logger.info("\n".join(plan))
 
         if dry_run:
             logger.info("✅ Dry run complete. Use without --dry-run to execute.")
@@ -188,20 +213,25 @@ def rollback_model(
         }
         rollback_target.log_metadata(rollback_metadata)
 
-        logger.info("")
-        logger.info("✅ Rollback completed successfully!")
-        logger.info(f"  Previous production: v{current_prod.number} → archived")
-        logger.info(f"  New production: v{rollback_target.number}")
-        logger.info("")
-        logger.info("📋 Rollback logged for compliance audit trail")
-
-        # Provide next steps
-        logger.info("")
-        logger.info("Next steps:")
-        logger.info("  1. Verify the rollback in the ZenML dashboard")
-        logger.info("  2. Monitor model performance in Arize/monitoring")
-        logger.info("  3. Investigate why the demoted model underperformed")
-        logger.info("  4. Create a post-mortem if this was a production incident")
+        # Summarize and provide next steps
+        logger.info(
+            "\n".join(
+                [
+                    "",
+                    "✅ Rollback completed successfully!",
+                    f"  Previous production: v{current_prod.number} → archived",
+                    f"  New production: v{rollback_target.number}",
+                    "",
+                    "📋 Rollback logged for compliance audit trail",
+                    "",
+                    "Next steps:",
+                    "  1. Verify the rollback in the ZenML dashboard",
+                    "  2. Monitor model performance in Arize/monitoring",
+                    "  3. Investigate why the demoted model underperformed",
+                    "  4. Create a post-mortem if this was a production incident",
+                ]
+            )
+        )
 
     except click.Abort:
         raise
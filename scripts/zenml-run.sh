@@ -0,0 +1,20 @@
+#!/bin/sh
+# Apache Software License 2.0
+#
+# Copyright (c) ZenML GmbH 2026. All rights reserved.
+#
+# Fast-start wrapper around run.py for CI and containers.
+#
+# Usage: scripts/zenml-run.sh [run.py options]
+#   e.g. scripts/zenml-run.sh --pipeline training --environment staging
+#
+# - Frozen stdlib modules are forced on (they are off in some dev builds).
+# - PYTHONSAFEPATH stops Python from prepending the working directory and
+#   scanning it on every import; the repo root is added explicitly instead.
+# Must be run from the repo root, like run.py, so configs/ resolves.
+
+REPO_ROOT="$(cd "$(dirname "$0")/.." && pwd)"
+
+PYTHONSAFEPATH=1 \
+PYTHONPATH="$REPO_ROOT${PYTHONPATH:+:$PYTHONPATH}" \
+    exec python -X frozen_modules=on -m src.cli.run "$@"
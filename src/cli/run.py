@@ -0,0 +1,139 @@
+# Apache Software License 2.0
+#
+# Copyright (c) ZenML GmbH 2026. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Implementation of the `run.py` / `zenml-run` pipeline runner.
+
+Usage:
+    python run.py                                        # training, local mode
+    python run.py --pipeline batch_inference             # other pipelines
+    python run.py --environment staging                  # with governance hooks
+    python run.py --environment staging --stack my-stack # explicit stack
+"""
+
+import functools
+from pathlib import Path
+
+import click
+from zenml.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Config files per environment (docker settings, parameters, etc.)
+CONFIG_DIR = Path("configs")
+
+# Default stacks per environment
+STACK_DEFAULTS = {
+    "local": "dev-stack",
+    "staging": "staging-stack",
+    "production": "staging-stack",
+}
+
+
+@functools.cache
+def _client():
+    """Return a process-wide ZenML client, created on first use."""
+    from zenml.client import Client
+
+    return Client()
+
+
+@functools.cache
+def _governance_hooks():
+    """Import governance hooks on first use; local runs never pay for them."""
+    from governance.hooks import (
+        pipeline_failure_hook,
+        pipeline_governance_success_hook,
+    )
+
+    return pipeline_governance_success_hook, pipeline_failure_hook
+
+
+def activate_stack(stack_name: str) -> None:
+    """Activate a stack, with fallback to current stack if not found."""
+    client = _client()
+    try:
+        client.activate_stack(stack_name)
+        logger.info("Using stack: %s", stack_name)
+    except KeyError:
+        logger.warning(
+            "Stack '%s' not found, using: %s",
+            stack_name,
+            client.active_stack_model.name,
+        )
+
+
+@click.command()
+@click.option(
+    "--pipeline",
+    type=click.Choice(["training", "batch_inference", "champion_challenger"]),
+    default="training",
+)
+@click.option(
+    "--environment",
+    type=click.Choice(["local", "staging", "production"]),
+    default="local",
+    help="local = fast iteration, staging/production = with governance hooks and drift detection",
+)
+@click.option(
+    "--stack",
+    type=str,
+    default=None,
+    help="Stack to use (default: dev-stack for local, staging-stack for staging, gcp-stack for production)",
+)
+def main(pipeline: str, environment: str, stack: str | None):
+    """Run ZenML pipelines for patient readmission prediction."""
+    # Set stack (explicit override or environment default)
+    stack_name = stack or STACK_DEFAULTS.get(environment)
+    if stack_name:
+        activate_stack(stack_name)
+
+    logger.info("Running %s pipeline (%s mode)", pipeline, environment)
+
+    if pipeline == "training":
+        from src.pipelines.training import training_pipeline
+
+        # Load config (docker settings, parameters, tags, etc.)
+        config_path = CONFIG_DIR / f"{environment}.yaml"
+        if config_path.exists():
+            pipeline_to_run = training_pipeline.with_options(config_path=str(config_path))
+            logger.info("Loaded config: %s", config_path)
+        else:
+            pipeline_to_run = training_pipeline
+
+        if environment == "local":
+            # Local: fast iteration, no governance steps or hooks
+            pipeline_to_run(environment=environment, enable_governance=False)
+        else:
+            # Staging: add governance hooks
+            on_success, on_failure = _governance_hooks()
+            pipeline_to_run.with_options(
+                on_success=on_success,
+                on_failure=on_failure,
+            )(environment=environment, enable_governance=True)
+
+    elif pipeline == "batch_inference":
+        from src.pipelines.batch_inference import batch_inference_pipeline
+
+        batch_inference_pipeline()
+
+    elif pipeline == "champion_challenger":
+        from src.pipelines.champion_challenger import champion_challenger_pipeline
+
+        champion_challenger_pipeline()
+
+
+if __name__ == "__main__":
+    main()
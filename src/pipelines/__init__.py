@@ -18,12 +18,16 @@
 
 from src.pipelines.batch_inference import batch_inference_pipeline
 from src.pipelines.champion_challenger import champion_challenger_pipeline
-from src.pipelines.realtime_inference import inference_service
+from src.pipelines.realtime_inference import (
+    inference_service,
+    inference_service_batch,
+)
 from src.pipelines.training import training_pipeline
 
 __all__ = [
     "batch_inference_pipeline",
     "champion_challenger_pipeline",
     "inference_service",
+    "inference_service_batch",
     "training_pipeline",
 ]
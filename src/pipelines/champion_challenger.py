@@ -32,43 +32,117 @@ Example:
     python run.py --pipeline champion_challenger
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Annotated
 
+import joblib
+import numpy as np
 import pandas as pd
+from sklearn.datasets import load_breast_cancer
 from zenml import Model, get_step_context, pipeline, step
+from zenml.client import Client
 from zenml.enums import ModelStages
 from zenml.logger import get_logger
 
+from src.utils import (
+    load_model_artifact,
+    parallel_predict_proba,
+    resolve_model_version,
+    scale_features_frame,
+)
+
 MODEL_NAME = "breast_cancer_classifier"
 logger = get_logger(__name__)
 
+# Comparison report layout and recommendation texts, filled in by
+# generate_comparison_report
+_REPORT_TEMPLATE = """
+# Champion vs Challenger Model Comparison Report
+
+## Model Versions
+- **Champion (Current Staging)**: v{champion_version}
+- **Challenger (Latest Trained)**: v{challenger_version}
 
-@step
+## Prediction Agreement
+- **Total Samples**: {total_samples:,}
+- **Agreement Rate**: {agreement_rate:.2%}
+- **Disagreement Rate**: {disagreement_rate:.2%}
+
+## Prediction Distribution
+- **Champion Positive Rate**: {champion_positive_rate:.2%}
+- **Challenger Positive Rate**: {challenger_positive_rate:.2%}
+
+## Probability Calibration
+- **Average Probability Difference**: {avg_probability_diff:.4f}
+- **Maximum Probability Difference**: {max_probability_diff:.4f}
+
+## Recommendation
+{recommendation}"""
+
+_RECOMMENDATIONS = {
+    "safe": """
+**SAFE TO PROMOTE**: Models are highly aligned. Challenger can likely be
+promoted to staging with minimal risk. Merge the PR to promote.
+""",
+    "review": """
+**REVIEW RECOMMENDED**: Models show reasonable agreement but some divergence.
+Review disagreement cases before merging PR to promote to staging.
+""",
+    "caution": """
+**CAUTION**: Significant prediction differences detected. Investigate root
+cause before considering promotion. Consider:
+- Feature drift between training and inference data
+- Model architecture differences
+- Training data differences
+""",
+}
+
+
+@step(enable_cache=True)  # Deterministic (fixed dataset + seed); overrides pipeline
 def load_inference_data() -> Annotated[pd.DataFrame, "inference_data"]:
     """Load data for inference comparison.
 
     Uses the same breast cancer dataset as training to ensure feature compatibility.
-    In production, this would load from BigQuery, GCS, or another data source.
+    In production, this would load from BigQuery, GCS, or another data source
+    (and caching would need to key on the source snapshot).
     """
-    from sklearn.datasets import load_breast_cancer
-
-    # Load same dataset as training pipeline
-    data = load_breast_cancer(as_frame=True)
-    X = data.data
-
-    # Return a sample for comparison (simulating new inference data)
-    return X.sample(n=min(200, len(X)), random_state=42)
+    # Load same dataset as training pipeline, as plain arrays: only the sampled
+    # rows are turned into a DataFrame
+    data = load_breast_cancer()
+    n_rows = len(data.data)
+
+    # Return a sample for comparison (simulating new inference data). Same rows,
+    # order and index as the full frame's .sample(n, random_state=42)
+    rows = np.random.RandomState(42).choice(
+        n_rows, size=min(200, n_rows), replace=False
+    )
+    return pd.DataFrame(data.data[rows], columns=data.feature_names, index=rows)
 
 
 def find_latest_staging_trained_model(client):
     """Find the latest model version trained with environment=staging.
 
     This identifies the challenger model from Chapter 2 (staging training).
+    The server filters on the run metadata and returns only the newest match;
+    if that comes back empty, the most recent versions are scanned client-side
+    so metadata stored in an unexpected form is still found.
     """
-    versions = client.list_model_versions(model=MODEL_NAME, size=100)
-    sorted_versions = sorted(versions, key=lambda v: v.number, reverse=True)
+    matches = client.list_model_versions(
+        model=MODEL_NAME,
+        run_metadata=["environment:staging"],
+        sort_by="desc:number",
+        size=1,
+        hydrate=True,
+    )
+    if matches.items:
+        version = matches.items[0]
+        logger.info(f"Found staging-trained model: v{version.number}")
+        return version
 
-    for version in sorted_versions:
+    versions = client.list_model_versions(
+        model=MODEL_NAME, sort_by="desc:number", size=100, hydrate=True
+    )
+    for version in versions:
         metadata = version.run_metadata or {}
         env_meta = metadata.get("environment")
         if env_meta:
@@ -81,100 +155,148 @@ def find_latest_staging_trained_model(client):
     return None
 
 
-@step
-def predict_with_model(
-    data: pd.DataFrame,
-    model_stage: str,
-) -> Annotated[pd.DataFrame, "predictions"]:
-    """Run predictions using a model from a specific stage.
+def _resolve_model_version(client, context, model_stage: str):
+    """Resolve the model version used for a comparison role.
 
     Args:
-        data: Input features for prediction
+        client: ZenML client
+        context: Current step context (its model is the LATEST fallback)
         model_stage: Which model to use:
             - "staging": Champion (current staging stage model)
             - "challenger": Challenger (latest model trained with environment=staging)
     """
-    from zenml.client import Client
-
-    context = get_step_context()
-    client = Client()
-
-    # Load model from the specified stage
     if model_stage == "staging":
         # Champion: current staging model (has been promoted to staging stage)
         try:
-            model_version = client.get_model_version(
-                model_name_or_id=MODEL_NAME,
-                model_version_name_or_number_or_id=ModelStages.STAGING,
-            )
+            return resolve_model_version(MODEL_NAME, ModelStages.STAGING)
         except KeyError:
             logger.warning("No staging model found, using latest for both")
-            model_version = context.model
-    else:
-        # Challenger: latest model trained with environment=staging (from Ch2)
-        model_version = find_latest_staging_trained_model(client)
-        if model_version is None:
-            # Fallback to pipeline's model (LATEST)
-            model_version = context.model
-
-    # Load artifacts
-    model_artifact = model_version.get_artifact("sklearn_classifier")
-    scaler_artifact = model_version.get_artifact("scaler")
-
-    if model_artifact is None:
-        raise ValueError(f"No model artifact found for stage: {model_stage}")
-
-    model = model_artifact.load()
-    scaler = scaler_artifact.load() if scaler_artifact else None
-
-    # Preprocess and predict
-    X = data.copy()
-    if scaler is not None:
-        X = pd.DataFrame(scaler.transform(X), columns=data.columns)
-
-    predictions = model.predict(X)
-    probabilities = model.predict_proba(X)[:, 1]
-
-    results = pd.DataFrame(
-        {
-            "prediction": predictions,
-            "probability": probabilities,
+            return context.model
+
+    # Challenger: latest model trained with environment=staging (from Ch2)
+    model_version = find_latest_staging_trained_model(client)
+    if model_version is None:
+        # Fallback to pipeline's model (LATEST)
+        model_version = context.model
+    return model_version
+
+
+@step
+def predict_champion_challenger(
+    data: pd.DataFrame,
+) -> tuple[
+    Annotated[pd.DataFrame, "champion_predictions"],
+    Annotated[pd.DataFrame, "challenger_predictions"],
+    Annotated[dict, "compared_models"],
+]:
+    """Run predictions with both the champion and the challenger model.
+
+    Both models are scored in one step so the inference data is loaded once,
+    the two models are fetched concurrently and, when both versions share the
+    same fitted scaler, the features are scaled once.
+
+    The prediction frames only carry per-row values; which stage and version
+    produced them is returned once in a separate dict rather than repeated
+    on every row.
+
+    Args:
+        data: Input features for prediction
+
+    Returns:
+        Tuple of (champion predictions, challenger predictions, compared
+        models keyed by "champion"/"challenger")
+    """
+    context = get_step_context()
+    client = Client()
+
+    def load_role(model_stage: str):
+        model_version = _resolve_model_version(client, context, model_stage)
+
+        # Load artifacts (cached per worker process)
+        model = load_model_artifact(
+            MODEL_NAME, model_version.number, "sklearn_classifier"
+        )
+        if model is None:
+            raise ValueError(f"No model artifact found for stage: {model_stage}")
+        scaler = load_model_artifact(MODEL_NAME, model_version.number, "scaler")
+        return model_stage, model_version, model, scaler
+
+    # Resolving and downloading the two models is network-bound and
+    # independent, so do both at once. Connect the store first so the
+    # workers don't race on the shared client's lazy initialization.
+    client.zen_store  # noqa: B018
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        loaded = list(executor.map(load_role, ("staging", "challenger")))
+
+    results = []
+    compared_models = {}
+    scaled_features = {}  # scaler hash -> features already scaled by it
+    for role, (model_stage, model_version, model, scaler) in zip(
+        ("champion", "challenger"), loaded
+    ):
+        # Preprocess, reusing the champion's output if the scaler is identical
+        if scaler is None:
+            X = data
+        else:
+            scaler_hash = joblib.hash(scaler)
+            X = scaled_features.get(scaler_hash)
+            if X is None:
+                # float32 after (not before) scaling: identical predictions,
+                # and the forest skips its own float64 -> float32 copy
+                X = scale_features_frame(scaler, data)
+                scaled_features[scaler_hash] = X
+
+        # One forest pass: predict() is the argmax of predict_proba()
+        class_probabilities = parallel_predict_proba(model, X)
+        # Emit compact dtypes: labels are binary 0/1, and float32 keeps far more
+        # precision than a forest's vote fractions carry
+        predictions = model.classes_.astype(np.int8)[class_probabilities.argmax(axis=1)]
+        probabilities = class_probabilities[:, 1].astype(np.float32)
+
+        results.append(
+            pd.DataFrame(
+                {"prediction": predictions, "probability": probabilities},
+                copy=False,
+            )
+        )
+        compared_models[role] = {
             "model_stage": model_stage,
             "model_version": str(model_version.number),
         }
-    )
 
-    return results
+    champion_predictions, challenger_predictions = results
+    return champion_predictions, challenger_predictions, compared_models
 
 
 @step
 def compare_predictions(
     champion_predictions: pd.DataFrame,
     challenger_predictions: pd.DataFrame,
+    compared_models: dict,
     inference_data: pd.DataFrame,
 ) -> Annotated[dict, "comparison_metrics"]:
     """Compare champion and challenger model predictions.
 
     Calculates agreement metrics and flags cases where models disagree.
     """
+    champion_pred = champion_predictions["prediction"].to_numpy()
+    challenger_pred = challenger_predictions["prediction"].to_numpy()
+
+    # Compute the per-sample probability gap once and take both stats from it
+    probability_diff = np.abs(
+        champion_predictions["probability"].to_numpy()
+        - challenger_predictions["probability"].to_numpy()
+    )
+
     comparison = {
-        "champion_version": champion_predictions["model_version"].iloc[0],
-        "challenger_version": challenger_predictions["model_version"].iloc[0],
+        "champion_version": compared_models["champion"]["model_version"],
+        "challenger_version": compared_models["challenger"]["model_version"],
         "total_samples": len(inference_data),
-        "agreement_rate": (
-            champion_predictions["prediction"].values
-            == challenger_predictions["prediction"].values
-        ).mean(),
-        "champion_positive_rate": champion_predictions["prediction"].mean(),
-        "challenger_positive_rate": challenger_predictions["prediction"].mean(),
-        "avg_probability_diff": abs(
-            champion_predictions["probability"].values
-            - challenger_predictions["probability"].values
-        ).mean(),
-        "max_probability_diff": abs(
-            champion_predictions["probability"].values
-            - challenger_predictions["probability"].values
-        ).max(),
+        "agreement_rate": float((champion_pred == challenger_pred).mean()),
+        "champion_positive_rate": float(champion_pred.mean()),
+        "challenger_positive_rate": float(challenger_pred.mean()),
+        "avg_probability_diff": float(probability_diff.mean()),
+        "max_probability_diff": float(probability_diff.max()),
     }
 
     # Log comparison to Model Control Plane
@@ -192,52 +314,21 @@ def generate_comparison_report(
 
     This report helps stakeholders decide whether to promote the challenger.
     """
-    report = f"""
-# Champion vs Challenger Model Comparison Report
-
-## Model Versions
-- **Champion (Current Staging)**: v{comparison_metrics["champion_version"]}
-- **Challenger (Latest Trained)**: v{comparison_metrics["challenger_version"]}
-
-## Prediction Agreement
-- **Total Samples**: {comparison_metrics["total_samples"]:,}
-- **Agreement Rate**: {comparison_metrics["agreement_rate"]:.2%}
-- **Disagreement Rate**: {1 - comparison_metrics["agreement_rate"]:.2%}
-
-## Prediction Distribution
-- **Champion Positive Rate**: {comparison_metrics["champion_positive_rate"]:.2%}
-- **Challenger Positive Rate**: {comparison_metrics["challenger_positive_rate"]:.2%}
-
-## Probability Calibration
-- **Average Probability Difference**: {comparison_metrics["avg_probability_diff"]:.4f}
-- **Maximum Probability Difference**: {comparison_metrics["max_probability_diff"]:.4f}
-
-## Recommendation
-"""
-
     agreement = comparison_metrics["agreement_rate"]
     prob_diff = comparison_metrics["avg_probability_diff"]
 
     if agreement >= 0.95 and prob_diff < 0.05:
-        report += """
-**SAFE TO PROMOTE**: Models are highly aligned. Challenger can likely be
-promoted to staging with minimal risk. Merge the PR to promote.
-"""
+        verdict = "safe"
     elif agreement >= 0.85:
-        report += """
-**REVIEW RECOMMENDED**: Models show reasonable agreement but some divergence.
-Review disagreement cases before merging PR to promote to staging.
-"""
+        verdict = "review"
     else:
-        report += """
-**CAUTION**: Significant prediction differences detected. Investigate root
-cause before considering promotion. Consider:
-- Feature drift between training and inference data
-- Model architecture differences
-- Training data differences
-"""
+        verdict = "caution"
 
-    return report
+    return _REPORT_TEMPLATE.format(
+        **comparison_metrics,
+        disagreement_rate=1 - agreement,
+        recommendation=_RECOMMENDATIONS[verdict],
+    )
 
 
 @pipeline(
@@ -266,22 +357,15 @@ def champion_challenger_pipeline() -> str:
     inference_data = load_inference_data()
 
     # Run both models
-    champion_predictions = predict_with_model(
-        data=inference_data,
-        model_stage="staging",
-        id="champion_predict",
-    )
-
-    challenger_predictions = predict_with_model(
-        data=inference_data,
-        model_stage="challenger",
-        id="challenger_predict",
+    champion_predictions, challenger_predictions, compared_models = (
+        predict_champion_challenger(data=inference_data)
     )
 
     # Compare and report
     comparison_metrics = compare_predictions(
         champion_predictions=champion_predictions,
         challenger_predictions=challenger_predictions,
+        compared_models=compared_models,
         inference_data=inference_data,
     )
 
@@ -25,8 +25,12 @@ The pipeline creates proper lineage in the destination workspace while
 maintaining audit trail links back to the source workspace.
 """
 
+import base64
+import functools
+import io
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Annotated, Optional
 
@@ -34,7 +38,9 @@ import joblib
 from google.cloud import storage
 from sklearn.base import ClassifierMixin, TransformerMixin
 from zenml import ArtifactConfig, Model, get_step_context, log_metadata, pipeline, step
+from zenml.client import Client
 from zenml.enums import ArtifactType, ModelStages
+from zenml.io import fileio
 from zenml.logger import get_logger
 
 logger = get_logger(__name__)
@@ -51,121 +57,170 @@ USE_SHARED_ARTIFACT_STORE = (
     os.getenv("USE_SHARED_ARTIFACT_STORE", "false").lower() == "true"
 )
 
+# Content-addressed (MD5) cache of downloaded export artifacts, so retries and
+# repeated imports of the same export skip the transfer
+_IMPORT_CACHE_DIR = Path.home() / ".cache" / "zenml_imports"
+_IMPORT_CACHE_MAX_ENTRIES = 16
 
-def _download_from_gcs(gcs_uri: str, local_path: str) -> None:
-    """Download a file from GCS.
+_STAGE_MAP = {
+    "staging": ModelStages.STAGING,
+    "production": ModelStages.PRODUCTION,
+}
+
+
+@functools.cache
+def _active_project_name() -> str:
+    """Return the active project's name, resolved once per worker process."""
+    return Client().active_project.name
+
+
+@functools.cache
+def _gcs_bucket(bucket_name: str) -> storage.Bucket:
+    """Return a cached bucket handle for the direct GCS client path.
+
+    The model and scaler steps share one client per worker process, so
+    credential discovery and the HTTP connection pool are set up once.
+    Uses user_project for requester pays buckets.
+    """
+    client = storage.Client(project=DEFAULT_GCP_PROJECT)
+    return client.bucket(bucket_name, user_project=DEFAULT_GCP_PROJECT)
+
+
+def _split_gcs_uri(gcs_uri: str) -> tuple[str, str]:
+    """Split a gs://bucket/path URI into (bucket name, blob path).
+
+    Raises:
+        ValueError: If the URI is not a gs:// URI with a bucket
+    """
+    # Not urlsplit: object names may legally contain "?" and "#"
+    bucket_name, _, blob_path = gcs_uri.removeprefix("gs://").partition("/")
+    if not gcs_uri.startswith("gs://") or not bucket_name:
+        raise ValueError(f"Invalid GCS URI: {gcs_uri}")
+    return bucket_name, blob_path
+
+
+def _read_from_gcs(gcs_uri: str) -> bytes:
+    """Read a file from GCS into memory.
 
     Uses ZenML's fileio when using shared artifact store (recommended),
     otherwise uses direct GCS client for separate bucket architecture.
+    Exported sklearn artifacts are a few MB, so there is no need to stage
+    them on local disk before deserializing.
 
     Args:
         gcs_uri: Full GCS URI (gs://bucket/path)
-        local_path: Path to save locally
+
+    Returns:
+        The file contents
     """
     if USE_SHARED_ARTIFACT_STORE:
         # Shared artifact store: fileio works because bucket is within bounds
-        from zenml.io import fileio
-
-        fileio.copy(gcs_uri, local_path, overwrite=True)
+        with fileio.open(gcs_uri, "rb") as f:
+            return f.read()
     else:
         # Separate buckets: use direct GCS client to bypass bounds validation
-        if not gcs_uri.startswith("gs://"):
-            raise ValueError(f"Invalid GCS URI: {gcs_uri}")
-        parts = gcs_uri[5:].split("/", 1)
-        bucket_name = parts[0]
-        blob_path = parts[1] if len(parts) > 1 else ""
-
-        # Use user_project for requester pays buckets
-        gcp_project = os.getenv("GCP_PROJECT_ID", DEFAULT_GCP_PROJECT)
-        client = storage.Client(project=gcp_project)
-        bucket = client.bucket(bucket_name, user_project=gcp_project)
-        blob = bucket.blob(blob_path)
-        blob.download_to_filename(local_path)
+        bucket_name, blob_path = _split_gcs_uri(gcs_uri)
+        return _download_cached(_gcs_bucket(bucket_name).blob(blob_path))
 
 
-@step
-def download_and_register_model(
-    export_path: str,
-    import_metadata: dict,
-) -> Annotated[
-    ClassifierMixin,
-    ArtifactConfig(name="sklearn_classifier", artifact_type=ArtifactType.MODEL),
-]:
-    """Download and register imported model artifact from GCS.
+def _download_cached(blob: storage.Blob) -> bytes:
+    """Download a blob, reusing a local copy with the same MD5 if there is one.
 
-    Uses direct GCS client to download from the model exchange bucket,
-    which is intentionally outside the artifact store bounds.
+    The cache is keyed on content, so a hit can never be stale. Least recently
+    used entries (by mtime, refreshed on every hit) are evicted beyond
+    _IMPORT_CACHE_MAX_ENTRIES. Cache writes are best effort.
 
     Args:
-        export_path: GCS path to the export directory
-        import_metadata: Metadata from the export manifest
+        blob: GCS blob to download
 
     Returns:
-        The registered model artifact
+        The blob contents
     """
-    source = import_metadata.get("source", {})
-    logger.info(
-        f"Registering model from {source.get('workspace')} v{source.get('model_version')}"
-    )
-
-    # Download model directly from GCS (bypasses artifact store bounds)
-    model_uri = f"{export_path}/model.joblib"
-
-    with tempfile.NamedTemporaryFile(suffix=".joblib", delete=False) as tmp:
-        tmp_path = tmp.name
+    blob.reload()  # Metadata only; populates blob.md5_hash
+    if not blob.md5_hash:  # Composite objects have no MD5
+        return blob.download_as_bytes()
 
+    cache_path = _IMPORT_CACHE_DIR / base64.b64decode(blob.md5_hash).hex()
     try:
-        _download_from_gcs(model_uri, tmp_path)
-        model = joblib.load(tmp_path)
-    finally:
-        tmp_file = Path(tmp_path)
-        if tmp_file.exists():
-            tmp_file.unlink()
-
-    logger.info("Downloaded and registered model artifact")
-    return model
+        data = cache_path.read_bytes()
+        os.utime(cache_path)
+        logger.info(f"Using cached copy of gs://{blob.bucket.name}/{blob.name}")
+        return data
+    except OSError:
+        pass
+
+    data = blob.download_as_bytes()
+    try:
+        _IMPORT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=_IMPORT_CACHE_DIR, delete=False, suffix=".tmp"
+        ) as f:
+            f.write(data)
+        Path(f.name).replace(cache_path)
+
+        entries = sorted(
+            (p for p in _IMPORT_CACHE_DIR.iterdir() if p.suffix != ".tmp"),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True,
+        )
+        for stale in entries[_IMPORT_CACHE_MAX_ENTRIES:]:
+            stale.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"Could not cache downloaded artifact: {e}")
+    return data
 
 
 @step
-def download_and_register_scaler(
+def download_and_register_artifacts(
     export_path: str,
+    import_metadata: dict,
     has_scaler: bool,
-) -> Annotated[
-    Optional[TransformerMixin],
-    ArtifactConfig(name="scaler", artifact_type=ArtifactType.MODEL),
+) -> tuple[
+    Annotated[
+        ClassifierMixin,
+        ArtifactConfig(name="sklearn_classifier", artifact_type=ArtifactType.MODEL),
+    ],
+    Annotated[
+        Optional[TransformerMixin],
+        ArtifactConfig(name="scaler", artifact_type=ArtifactType.MODEL),
+    ],
 ]:
-    """Download and register imported scaler artifact if present.
+    """Download and register the imported model and scaler artifacts from GCS.
 
     Uses direct GCS client to download from the model exchange bucket,
-    which is intentionally outside the artifact store bounds.
+    which is intentionally outside the artifact store bounds. The two
+    downloads are independent and network-bound, so they run concurrently
+    rather than as two sequential steps.
 
     Args:
         export_path: GCS path to the export directory
+        import_metadata: Metadata from the export manifest
         has_scaler: Whether a scaler artifact exists
 
     Returns:
-        The registered scaler artifact or None
+        Tuple of (registered model, registered scaler or None)
     """
-    if not has_scaler:
-        logger.info("No scaler to import")
-        return None
-
-    # Download scaler directly from GCS (bypasses artifact store bounds)
-    scaler_uri = f"{export_path}/scaler.joblib"
+    source = import_metadata.get("source", {})
+    logger.info(
+        f"Registering model from {source.get('workspace')} v{source.get('model_version')}"
+    )
 
-    with tempfile.NamedTemporaryFile(suffix=".joblib", delete=False) as tmp:
-        tmp_path = tmp.name
+    def load(name: str):
+        # Download directly from GCS (bypasses artifact store bounds)
+        uri = f"{export_path.rstrip('/')}/{name}"
+        return joblib.load(io.BytesIO(_read_from_gcs(uri)))
 
-    try:
-        _download_from_gcs(scaler_uri, tmp_path)
-        scaler = joblib.load(tmp_path)
-    finally:
-        tmp_file = Path(tmp_path)
-        if tmp_file.exists():
-            tmp_file.unlink()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        model_future = executor.submit(load, "model.joblib")
+        scaler_future = executor.submit(load, "scaler.joblib") if has_scaler else None
+        model = model_future.result()
+        scaler = scaler_future.result() if scaler_future else None
 
-    logger.info("Downloaded and registered scaler artifact")
-    return scaler
+    if scaler is None:
+        logger.info("Downloaded and registered model artifact (no scaler to import)")
+    else:
+        logger.info("Downloaded and registered model and scaler artifacts")
+    return model, scaler
 
 
 @step
@@ -191,11 +246,6 @@ def log_cross_workspace_metadata(
     source = import_metadata.get("source", {})
     metrics = import_metadata.get("metrics", {})
 
-    # Log original metrics (for dashboard visibility)
-    if metrics:
-        log_metadata(metadata=metrics, infer_model=True)
-        logger.info(f"Logged {len(metrics)} metrics to model version")
-
     # Get current pipeline run context for import_run_url
     context = get_step_context()
     pipeline_run = context.pipeline_run
@@ -206,11 +256,7 @@ def log_cross_workspace_metadata(
     if promotion_chain and promotion_chain[-1].get("action") == "imported":
         workspace_name = promotion_chain[-1].get("to_workspace")
 
-    # Get project name from client
-    from zenml.client import Client
-
-    client = Client()
-    project_name = client.active_project.name
+    project_name = _active_project_name()
 
     # Build import pipeline run URL
     # Format: https://cloud.zenml.io/workspaces/{workspace}/projects/{project}/runs/{run_id}?tab=overview
@@ -229,7 +275,7 @@ def log_cross_workspace_metadata(
     ):
         promotion_chain[-1]["import_run_url"] = import_run_url
 
-    # Log source lineage information
+    # Source lineage information
     lineage_metadata = {
         "source": {
             "workspace": source.get("workspace"),
@@ -244,8 +290,13 @@ def log_cross_workspace_metadata(
         "imported_at": import_metadata.get("export_timestamp"),
     }
 
-    log_metadata(metadata=lineage_metadata, infer_model=True)
-    logger.info("Logged cross-workspace lineage metadata")
+    # Log original metrics (top-level, for dashboard visibility) and lineage in
+    # one request; lineage wins on the shared git_commit key, as it always did
+    log_metadata(metadata={**metrics, **lineage_metadata}, infer_model=True)
+    logger.info(
+        f"Logged {len(metrics)} metrics and cross-workspace lineage metadata "
+        "to model version"
+    )
 
     return {
         "status": "imported",
@@ -271,13 +322,8 @@ def set_model_stage(
     """
     context = get_step_context()
 
-    stage_map = {
-        "staging": ModelStages.STAGING,
-        "production": ModelStages.PRODUCTION,
-    }
-
-    if dest_stage in stage_map:
-        context.model.set_stage(stage_map[dest_stage], force=True)
+    if dest_stage in _STAGE_MAP:
+        context.model.set_stage(_STAGE_MAP[dest_stage], force=True)
         logger.info(f"Model stage set to: {dest_stage}")
 
     return f"Stage set to {dest_stage}"
@@ -319,13 +365,9 @@ def import_model_pipeline(
         dest_stage: Target stage in destination workspace
     """
     # Download and register artifacts from GCS
-    registered_model = download_and_register_model(
+    registered_model, _ = download_and_register_artifacts(
         export_path=export_path,
         import_metadata=import_metadata,
-    )
-
-    download_and_register_scaler(
-        export_path=export_path,
         has_scaler=has_scaler,
     )
 
@@ -50,11 +50,80 @@ Example:
 Uses breast cancer dataset features for demo. See PatientData model for all fields.
 """
 
-from typing import Annotated
+import functools
+import secrets
+from typing import Annotated, Callable
 
+import numpy as np
 from pydantic import BaseModel
-from zenml import pipeline, step
+from sklearn.preprocessing import StandardScaler
+from zenml import get_step_context, pipeline, step
 from zenml.enums import ModelStages
+from zenml.logger import get_logger
+
+from src.utils import load_model_artifact, resolve_model_version, standardize
+
+logger = get_logger(__name__)
+
+MODEL_NAME = "breast_cancer_classifier"
+
+# Feature order must match sklearn breast_cancer dataset
+FEATURE_ORDER = (
+    "mean_radius",
+    "mean_texture",
+    "mean_perimeter",
+    "mean_area",
+    "mean_smoothness",
+    "mean_compactness",
+    "mean_concavity",
+    "mean_concave_points",
+    "mean_symmetry",
+    "mean_fractal_dimension",
+    "radius_error",
+    "texture_error",
+    "perimeter_error",
+    "area_error",
+    "smoothness_error",
+    "compactness_error",
+    "concavity_error",
+    "concave_points_error",
+    "symmetry_error",
+    "fractal_dimension_error",
+    "worst_radius",
+    "worst_texture",
+    "worst_perimeter",
+    "worst_area",
+    "worst_smoothness",
+    "worst_compactness",
+    "worst_concavity",
+    "worst_concave_points",
+    "worst_symmetry",
+    "worst_fractal_dimension",
+)
+
+# Heuristic explanations based on breast cancer risk factors, as
+# (feature, threshold, label); a risk factor applies above its threshold, a
+# protective factor below. In production, use SHAP/LIME for accurate explanations
+_RISK_FACTORS = (
+    ("mean_radius", 15, "Large mean radius"),
+    ("mean_concavity", 0.1, "High concavity"),
+    ("worst_radius", 18, "Large worst radius"),
+    ("worst_concave_points", 0.15, "High worst concave points"),
+)
+_PROTECTIVE_FACTORS = (("mean_smoothness", 0.09, "Low smoothness"),)
+
+
+def _factor_table(factors: tuple) -> tuple[list[int], np.ndarray, tuple[str, ...]]:
+    """Split factor rules into feature columns, thresholds and labels."""
+    features, thresholds, labels = zip(*factors)
+    columns = [FEATURE_ORDER.index(feature) for feature in features]
+    return columns, np.array(thresholds, dtype=np.float64), labels
+
+
+_RISK_COLUMNS, _RISK_THRESHOLDS, _RISK_LABELS = _factor_table(_RISK_FACTORS)
+_PROTECTIVE_COLUMNS, _PROTECTIVE_THRESHOLDS, _PROTECTIVE_LABELS = _factor_table(
+    _PROTECTIVE_FACTORS
+)
 
 
 class PatientData(BaseModel):
@@ -97,6 +166,12 @@ class PatientData(BaseModel):
     worst_fractal_dimension: float = 0.084
 
 
+class PatientBatch(BaseModel):
+    """A batch of patients scored in one request."""
+
+    patients: list[PatientData]
+
+
 class PredictionResult(BaseModel):
     """Prediction result returned by the service."""
 
@@ -108,90 +183,31 @@ class PredictionResult(BaseModel):
     explanation: dict
 
 
-@step
-def preprocess_request(
-    patient_data: PatientData,
-) -> Annotated[dict, "processed_features"]:
-    """Preprocess incoming patient data.
+def _explain(raw_features: np.ndarray) -> list[dict]:
+    """Simple feature importance explanation for each row of unscaled features.
 
-    Extracts features in the correct order to match training data.
+    All rules are evaluated for the whole batch with one comparison per
+    rule set.
     """
-    # Feature order must match sklearn breast_cancer dataset
-    feature_order = [
-        "mean_radius",
-        "mean_texture",
-        "mean_perimeter",
-        "mean_area",
-        "mean_smoothness",
-        "mean_compactness",
-        "mean_concavity",
-        "mean_concave_points",
-        "mean_symmetry",
-        "mean_fractal_dimension",
-        "radius_error",
-        "texture_error",
-        "perimeter_error",
-        "area_error",
-        "smoothness_error",
-        "compactness_error",
-        "concavity_error",
-        "concave_points_error",
-        "symmetry_error",
-        "fractal_dimension_error",
-        "worst_radius",
-        "worst_texture",
-        "worst_perimeter",
-        "worst_area",
-        "worst_smoothness",
-        "worst_compactness",
-        "worst_concavity",
-        "worst_concave_points",
-        "worst_symmetry",
-        "worst_fractal_dimension",
+    risk_hits = raw_features[:, _RISK_COLUMNS] > _RISK_THRESHOLDS
+    protective_hits = raw_features[:, _PROTECTIVE_COLUMNS] < _PROTECTIVE_THRESHOLDS
+    return [
+        {
+            "top_risk_factors": [
+                label for label, hit in zip(_RISK_LABELS, risk_row) if hit
+            ],
+            "protective_factors": [
+                label for label, hit in zip(_PROTECTIVE_LABELS, protective_row) if hit
+            ],
+        }
+        for risk_row, protective_row in zip(risk_hits, protective_hits)
     ]
 
-    raw = patient_data.model_dump()
-    features = [raw[f] for f in feature_order]
-
-    return {
-        "features": features,
-        "raw": raw,
-    }
-
-
-@step
-def predict(
-    processed_features: dict,
-) -> Annotated[PredictionResult, "prediction"]:
-    """Run inference using the loaded production model."""
-    import uuid
-
-    import numpy as np
-    from zenml.client import Client
-
-    # Load model and scaler directly from Model Control Plane
-    client = Client()
-    model_version = client.get_model_version(
-        model_name_or_id="breast_cancer_classifier",
-        model_version_name_or_number_or_id=ModelStages.PRODUCTION,
-    )
-
-    model_artifact = model_version.get_artifact("sklearn_classifier")
-    scaler_artifact = model_version.get_artifact("scaler")
-    if model_artifact is None:
-        raise RuntimeError("No production model found")
-
-    model = model_artifact.load()
-    scaler = scaler_artifact.load() if scaler_artifact else None
-    version = str(model_version.number)
-
-    # Make prediction - apply scaler first if available
-    features = np.array(processed_features["features"]).reshape(1, -1)
-    if scaler is not None:
-        features = scaler.transform(features)
-    prediction = int(model.predict(features)[0])
-    probability = float(model.predict_proba(features)[0, 1])
 
+def _build_result(
+    prediction: int, probability: float, version: str, explanation: dict
+) -> PredictionResult:
+    """Turn one patient's model output into the service's response."""
     # Determine risk level
     # Note: probability is P(benign), so low probability = high risk
     if probability > 0.7:
@@ -201,29 +217,8 @@ def predict(
     else:
         risk_level = "HIGH"
 
-    # Simple feature importance explanation
-    raw_data = processed_features["raw"]
-    explanation = {
-        "top_risk_factors": [],
-        "protective_factors": [],
-    }
-
-    # Heuristic explanations based on breast cancer risk factors
-    # In production, use SHAP/LIME for accurate explanations
-    if raw_data.get("mean_radius", 0) > 15:
-        explanation["top_risk_factors"].append("Large mean radius")
-    if raw_data.get("mean_concavity", 0) > 0.1:
-        explanation["top_risk_factors"].append("High concavity")
-    if raw_data.get("worst_radius", 0) > 18:
-        explanation["top_risk_factors"].append("Large worst radius")
-    if raw_data.get("worst_concave_points", 0) > 0.15:
-        explanation["top_risk_factors"].append("High worst concave points")
-
-    if raw_data.get("mean_smoothness", 0) < 0.09:
-        explanation["protective_factors"].append("Low smoothness")
-
     return PredictionResult(
-        patient_id=str(uuid.uuid4())[:8],
+        patient_id=secrets.token_hex(4),
         prediction=prediction,
         probability=round(probability, 4),
         risk_level=risk_level,
@@ -232,7 +227,184 @@ def predict(
     )
 
 
-@pipeline
+# Keyed on the model object, which load_model_artifact caches per version, so
+# repeated load_model_artifacts() calls don't re-convert the same model
+@functools.lru_cache(maxsize=8)
+def _compile_predict_proba(model) -> Callable[[np.ndarray], np.ndarray]:
+    """Return the fastest available predict_proba for the loaded model.
+
+    With the optional onnx extra installed (skl2onnx + onnxruntime), the model
+    is converted once to an ONNX graph, which skips sklearn's per-call input
+    validation and joblib dispatch; that overhead dominates when scoring a
+    single request. The graph is only used if it reproduces sklearn's
+    probabilities on a probe batch, otherwise sklearn is used as before.
+
+    Args:
+        model: Fitted sklearn classifier
+
+    Returns:
+        Callable mapping a (n_samples, n_features) array of (scaled) features
+        to class probabilities
+    """
+    try:
+        import onnxruntime
+        from skl2onnx import to_onnx
+    except ImportError:
+        logger.info("onnxruntime/skl2onnx not installed, scoring with sklearn")
+        return model.predict_proba
+
+    probe = np.random.default_rng(0).standard_normal((64, len(FEATURE_ORDER)))
+    try:
+        onnx_model = to_onnx(
+            model,
+            probe[:1].astype(np.float32),
+            options={id(model): {"zipmap": False}},
+        )
+        session_options = onnxruntime.SessionOptions()
+        session_options.intra_op_num_threads = 1  # Tuned for per-request latency
+        session = onnxruntime.InferenceSession(
+            onnx_model.SerializeToString(),
+            sess_options=session_options,
+            providers=["CPUExecutionProvider"],
+        )
+    except Exception as e:  # Converter doesn't support this estimator/version
+        logger.warning(f"ONNX conversion failed, scoring with sklearn: {e}")
+        return model.predict_proba
+
+    input_name = session.get_inputs()[0].name
+    probabilities_name = session.get_outputs()[1].name
+
+    def predict_proba(features: np.ndarray) -> np.ndarray:
+        # Trees compare in float32 in sklearn too, so this is the same input
+        inputs = {input_name: features.astype(np.float32, copy=False)}
+        return session.run([probabilities_name], inputs)[0]
+
+    if not np.allclose(predict_proba(probe), model.predict_proba(probe), atol=1e-5):
+        logger.warning("ONNX model disagrees with sklearn, scoring with sklearn")
+        return model.predict_proba
+
+    logger.info("Scoring with the ONNX Runtime version of the model")
+    return predict_proba
+
+
+def _compile_scaler(scaler) -> Callable[[np.ndarray], np.ndarray]:
+    """Return a float32 transform for the loaded scaler.
+
+    A fitted StandardScaler goes through standardize(), which skips
+    transform()'s validation and copies on every request while producing
+    the same float32 features (what the forest compares in anyway) as
+    scaler.transform(). Other scalers fall back to transform().
+
+    Args:
+        scaler: Fitted scaler, or None
+
+    Returns:
+        Callable mapping raw features to scaled float32 features
+    """
+    if scaler is None:
+        return lambda features: features.astype(np.float32)
+    if type(scaler) is not StandardScaler or not hasattr(scaler, "n_features_in_"):
+        return lambda features: scaler.transform(features).astype(np.float32)
+    return functools.partial(standardize, scaler)
+
+
+def load_model_artifacts() -> dict:
+    """Load the production model and scaler once per deployment.
+
+    Used as the pipeline's on_init hook: the returned dict becomes the
+    deployment's pipeline state, so requests reuse the unpickled objects
+    instead of fetching them from the Model Control Plane every time.
+    The underlying loads are cached per process, so calling this again
+    (e.g. when no pipeline state is available) is cheap.
+
+    Returns:
+        Dict with the "model", its "predict_proba" (ONNX Runtime if
+        available), a "scale" transform for raw features and the "version"
+    """
+    model_version = resolve_model_version(MODEL_NAME, ModelStages.PRODUCTION)
+    model = load_model_artifact(MODEL_NAME, model_version.number, "sklearn_classifier")
+    if model is None:
+        raise RuntimeError("No production model found")
+
+    return {
+        "model": model,
+        "predict_proba": _compile_predict_proba(model),
+        "scale": _compile_scaler(
+            load_model_artifact(MODEL_NAME, model_version.number, "scaler")
+        ),
+        "version": str(model_version.number),
+    }
+
+
+@step
+def infer(
+    patient_data: PatientData,
+) -> Annotated[PredictionResult, "prediction"]:
+    """Preprocess one patient's data and run inference with the production model.
+
+    Preprocessing and prediction share one step: the ordered feature vector
+    is only an intermediate value, so it is not worth a separate step run
+    and artifact on every request.
+    """
+    # Model and scaler were loaded by the on_init hook when the deployment
+    # started; outside a deployment there is no state, so load (cached) here
+    artifacts = get_step_context().pipeline_state or load_model_artifacts()
+    model = artifacts["model"]
+    version = artifacts["version"]
+
+    # Extract features in the correct order to match training data
+    raw = patient_data.model_dump()
+    raw_features = np.array([[raw[f] for f in FEATURE_ORDER]])
+
+    # Make prediction - apply scaler first if available. One forest pass:
+    # predict() is the argmax of predict_proba()
+    features = artifacts["scale"](raw_features)
+    class_probabilities = artifacts["predict_proba"](features)[0]
+    prediction = int(model.classes_[class_probabilities.argmax()])
+    probability = float(class_probabilities[1])
+
+    (explanation,) = _explain(raw_features)
+    return _build_result(prediction, probability, version, explanation)
+
+
+@step
+def predict_patient_batch(
+    batch: PatientBatch,
+) -> Annotated[list[PredictionResult], "predictions"]:
+    """Score a batch of patients with a single model call.
+
+    Stacking the batch into one feature matrix means sklearn's per-call
+    overhead (input validation, dispatch) is paid once per request rather
+    than once per patient.
+    """
+    if not batch.patients:
+        return []
+
+    artifacts = get_step_context().pipeline_state or load_model_artifacts()
+    model = artifacts["model"]
+    version = artifacts["version"]
+
+    raw_features = np.array(
+        [
+            [raw[f] for f in FEATURE_ORDER]
+            for raw in (patient.model_dump() for patient in batch.patients)
+        ]
+    )
+    features = artifacts["scale"](raw_features)
+
+    # One forest pass: predict() is the argmax of predict_proba()
+    class_probabilities = artifacts["predict_proba"](features)
+    predictions = model.classes_[class_probabilities.argmax(axis=1)]
+
+    return [
+        _build_result(int(prediction), float(probability), version, explanation)
+        for prediction, probability, explanation in zip(
+            predictions, class_probabilities[:, 1], _explain(raw_features)
+        )
+    ]
+
+
+@pipeline(on_init=load_model_artifacts)
 def inference_service(
     patient_data: PatientData = PatientData(),
 ) -> PredictionResult:
@@ -256,6 +428,32 @@ def inference_service(
             -H "Content-Type: application/json" \\
             -d '{"parameters": {"patient_data": {"age": 72, "num_inpatient": 3}}}'
     """
-    processed = preprocess_request(patient_data=patient_data)
-    result = predict(processed_features=processed)
-    return result
+    return infer(patient_data=patient_data)
+
+
+@pipeline(on_init=load_model_artifacts)
+def inference_service_batch(
+    batch: PatientBatch = PatientBatch(patients=[PatientData()]),
+) -> list[PredictionResult]:
+    """Real-time prediction service for batches of patients.
+
+    Same model and response format as inference_service, but scores every
+    patient in the request with one predict_proba call.
+
+    Args:
+        batch: Patients to score
+
+    Returns:
+        One prediction result per patient, in request order
+
+    Deploy with:
+        zenml pipeline deploy \\
+            src.pipelines.realtime_inference.inference_service_batch \\
+            --name readmission-batch-api
+
+    Invoke with:
+        curl -X POST http://localhost:8000/invoke \\
+            -H "Content-Type: application/json" \\
+            -d '{"parameters": {"batch": {"patients": [{"mean_radius": 14.0}]}}}'
+    """
+    return predict_patient_batch(batch=batch)
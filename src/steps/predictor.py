@@ -23,6 +23,8 @@ from sklearn.base import ClassifierMixin
 from zenml import step
 from zenml.logger import get_logger
 
+from src.utils import parallel_predict_proba
+
 logger = get_logger(__name__)
 
 
@@ -42,9 +44,10 @@ def predict_batch(
     """
     logger.info(f"Generating predictions for {len(X)} patients")
 
-    # Get predictions and probabilities
-    predictions = model.predict(X)
-    probabilities = model.predict_proba(X)[:, 1]
+    # Get predictions and probabilities from a single predict_proba() pass
+    class_probabilities = parallel_predict_proba(model, X)
+    predictions = model.classes_[class_probabilities.argmax(axis=1)]
+    probabilities = class_probabilities[:, 1]
 
     # Create results dataframe
     results = pd.DataFrame(
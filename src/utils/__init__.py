@@ -16,4 +16,22 @@
 
 """Utility functions for ML pipelines."""
 
-__all__: list[str] = []
+from src.utils.inference import (
+    parallel_predict_proba,
+    scale_features,
+    scale_features_frame,
+    standardize,
+)
+from src.utils.model_artifacts import (
+    load_model_artifact,
+    resolve_model_version,
+)
+
+__all__ = [
+    "load_model_artifact",
+    "parallel_predict_proba",
+    "resolve_model_version",
+    "scale_features",
+    "scale_features_frame",
+    "standardize",
+]
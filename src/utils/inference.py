@@ -0,0 +1,131 @@
+# Apache Software License 2.0
+#
+# Copyright (c) ZenML GmbH 2026. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for scoring large batches with sklearn classifiers."""
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import ClassifierMixin
+from sklearn.preprocessing import StandardScaler
+
+# Rows per chunk when fanning predict_proba out over threads
+PREDICT_CHUNK_SIZE = 10_000
+
+
+def standardize(scaler: StandardScaler, values: np.ndarray) -> np.ndarray:
+    """Apply a fitted StandardScaler's transform to a float64 array as float32.
+
+    Only the terms the scaler was configured with are applied (no centering
+    for with_mean=False, no scaling for with_std=False, even though mean_
+    may still be fitted). The arithmetic stays in float64 and is written
+    straight into the float32 output, so the result equals
+    scaler.transform(values).astype(np.float32) without its validation,
+    copies and separate astype() pass.
+
+    Args:
+        scaler: Fitted plain StandardScaler
+        values: Raw features in the scaler's column order
+
+    Returns:
+        Scaled features as a float32 array
+    """
+    if scaler.with_mean:
+        values = np.subtract(values, scaler.mean_)
+    out = np.empty(values.shape, np.float32)
+    if scaler.with_std:
+        return np.divide(values, scaler.scale_, out=out)
+    out[...] = values
+    return out
+
+
+def scale_features(scaler: StandardScaler, X: pd.DataFrame) -> np.ndarray:
+    """Standardize X with a fitted scaler, returning float32 features.
+
+    A plain StandardScaler fitted on these columns goes through
+    standardize() on one float64 working copy, matching
+    scaler.transform(X).astype(np.float32). Anything else (another scaler
+    type, unfitted, different columns) goes through scaler.transform(),
+    which also raises sklearn's usual errors.
+
+    Args:
+        scaler: Fitted scaler
+        X: Features to scale
+
+    Returns:
+        Scaled features as a float32 array
+    """
+    feature_names = getattr(scaler, "feature_names_in_", None)
+    if (
+        type(scaler) is not StandardScaler
+        or not hasattr(scaler, "n_features_in_")
+        or feature_names is None
+        or list(X.columns) != list(feature_names)
+    ):
+        return scaler.transform(X).astype(np.float32)
+
+    return standardize(scaler, X.to_numpy(dtype=np.float64))
+
+
+def scale_features_frame(scaler: StandardScaler, X: pd.DataFrame) -> pd.DataFrame:
+    """Scale X like scale_features(), keeping its column names and index.
+
+    The classifiers are fitted on named columns, so they get a DataFrame
+    rather than a bare array (which makes sklearn warn on every call). The
+    frame wraps the float32 array with copy=False: pandas 3 (and pandas 2
+    with copy-on-write enabled) would otherwise copy it on construction.
+
+    Args:
+        scaler: Fitted scaler
+        X: Features to scale
+
+    Returns:
+        Scaled float32 features, sharing memory with the scaled array
+    """
+    return pd.DataFrame(
+        scale_features(scaler, X), columns=X.columns, index=X.index, copy=False
+    )
+
+
+def parallel_predict_proba(
+    model: ClassifierMixin,
+    X: pd.DataFrame,
+    chunk_size: int = PREDICT_CHUNK_SIZE,
+) -> np.ndarray:
+    """Run predict_proba over row chunks on a thread pool.
+
+    Small batches, and estimators that already parallelize internally
+    (n_jobs set, e.g. our RandomForest), are scored with a single call so
+    the two levels of parallelism don't oversubscribe the cores. Threads
+    avoid pickling the model; sklearn/numpy release the GIL while scoring.
+
+    Args:
+        model: Fitted classifier
+        X: Features to score
+        chunk_size: Maximum rows per chunk
+
+    Returns:
+        Class probabilities, shape (n_samples, n_classes)
+    """
+    if len(X) <= chunk_size or getattr(model, "n_jobs", None) not in (None, 1):
+        return model.predict_proba(X)
+
+    chunks = (X.iloc[i : i + chunk_size] for i in range(0, len(X), chunk_size))
+    return np.vstack(
+        Parallel(n_jobs=-1, prefer="threads")(
+            delayed(model.predict_proba)(chunk) for chunk in chunks
+        )
+    )
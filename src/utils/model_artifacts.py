@@ -0,0 +1,91 @@
+# Apache Software License 2.0
+#
+# Copyright (c) ZenML GmbH 2026. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Process-level cache for deserialized Model Control Plane artifacts.
+
+Artifacts linked to a model version don't change once the version exists, so
+a worker that runs inference repeatedly (local orchestrator, notebooks,
+long-lived services) can reuse the unpickled estimator instead of downloading
+and deserializing it on every step run.
+"""
+
+import functools
+import time
+from typing import Any, Optional
+
+from zenml.enums import ModelStages
+from zenml.logger import get_logger
+
+logger = get_logger(__name__)
+
+# How long a stage -> model version resolution is reused. Stages can move at
+# any time (promotions happen from other processes), so keep this short.
+STAGE_RESOLUTION_TTL_SECONDS = 60
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_model_version(model_name: str, stage: ModelStages, _ttl_bucket: int):
+    from zenml.client import Client
+
+    return Client().get_model_version(
+        model_name_or_id=model_name,
+        model_version_name_or_number_or_id=stage,
+    )
+
+
+def resolve_model_version(model_name: str, stage: ModelStages):
+    """Resolve the model version currently in a stage, reusing recent lookups.
+
+    Results are cached for up to STAGE_RESOLUTION_TTL_SECONDS; the time bucket
+    is part of the cache key so entries expire without explicit invalidation.
+
+    Args:
+        model_name: Name of the model
+        stage: Stage to resolve (e.g. ModelStages.STAGING)
+
+    Returns:
+        The model version response
+
+    Raises:
+        KeyError: If no version is in the requested stage
+    """
+    bucket = int(time.monotonic() // STAGE_RESOLUTION_TTL_SECONDS)
+    return _resolve_model_version(model_name, stage, bucket)
+
+
+@functools.lru_cache(maxsize=8)
+def load_model_artifact(
+    model_name: str, version_number: int, artifact_name: str
+) -> Optional[Any]:
+    """Load an artifact from a model version, caching the loaded object.
+
+    Args:
+        model_name: Name of the model
+        version_number: Model version number
+        artifact_name: Name of the artifact linked to the version
+
+    Returns:
+        The loaded artifact, or None if the version has no such artifact
+    """
+    from zenml.client import Client
+
+    model_version = Client().get_model_version(model_name, version_number)
+    artifact = model_version.get_artifact(artifact_name)
+    if artifact is None:
+        return None
+
+    logger.info(f"Loading {artifact_name} from {model_name} v{version_number}")
+    return artifact.load()
@@ -0,0 +1,116 @@
+"""Unit tests for the GCS helpers used by the cross-workspace import pipeline."""
+
+import base64
+import hashlib
+import os
+import time
+
+import pytest
+
+
+def _md5(data: bytes) -> bytes:
+    """MD5 digest, as GCS reports it for a blob's contents."""
+    return hashlib.md5(data, usedforsecurity=False).digest()
+
+
+class FakeBlob:
+    """Minimal stand-in for google.cloud.storage.Blob."""
+
+    class _Bucket:
+        name = "exports"
+
+    def __init__(self, name: str, data: bytes):
+        self.name = name
+        self.bucket = self._Bucket()
+        self.md5_hash = base64.b64encode(_md5(data)).decode()
+        self.downloads = 0
+        self._data = data
+
+    def reload(self):
+        pass
+
+    def download_as_bytes(self) -> bytes:
+        self.downloads += 1
+        return self._data
+
+
+@pytest.fixture
+def import_cache(tmp_path, monkeypatch):
+    """Point the download cache at a temporary directory holding 2 entries."""
+    from src.pipelines import import_model
+
+    monkeypatch.setattr(import_model, "_IMPORT_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(import_model, "_IMPORT_CACHE_MAX_ENTRIES", 2)
+    return tmp_path
+
+
+class TestSplitGcsUri:
+    """Test gs:// URI parsing."""
+
+    @pytest.mark.parametrize(
+        "uri, expected",
+        [
+            (
+                "gs://exports/model/v1/model.joblib",
+                ("exports", "model/v1/model.joblib"),
+            ),
+            ("gs://exports/model/v1/", ("exports", "model/v1/")),
+            ("gs://exports", ("exports", "")),
+            ("gs://exports/a?b#c.joblib", ("exports", "a?b#c.joblib")),
+        ],
+    )
+    def test_valid_uris(self, uri, expected):
+        """Bucket and object name are split at the first slash only."""
+        from src.pipelines.import_model import _split_gcs_uri
+
+        assert _split_gcs_uri(uri) == expected
+
+    @pytest.mark.parametrize(
+        "uri", ["gs://", "gs:///model.joblib", "s3://exports/model.joblib", ""]
+    )
+    def test_invalid_uris(self, uri):
+        """URIs without a gs:// scheme or bucket are rejected."""
+        from src.pipelines.import_model import _split_gcs_uri
+
+        with pytest.raises(ValueError):
+            _split_gcs_uri(uri)
+
+
+class TestDownloadCached:
+    """Test the content-addressed download cache."""
+
+    def test_miss_downloads_and_stores(self, import_cache):
+        """A first download is written to the cache."""
+        from src.pipelines.import_model import _download_cached
+
+        blob = FakeBlob("model.joblib", b"model")
+
+        assert _download_cached(blob) == b"model"
+        assert blob.downloads == 1
+        assert [p.read_bytes() for p in import_cache.iterdir()] == [b"model"]
+
+    def test_hit_skips_download(self, import_cache):
+        """A blob with a cached MD5 is read from disk."""
+        from src.pipelines.import_model import _download_cached
+
+        _download_cached(FakeBlob("model.joblib", b"model"))
+        blob = FakeBlob("copy/model.joblib", b"model")
+
+        assert _download_cached(blob) == b"model"
+        assert blob.downloads == 0
+
+    def test_evicts_least_recently_used(self, import_cache):
+        """Entries beyond the limit are evicted oldest mtime first."""
+        from src.pipelines.import_model import _download_cached
+
+        _download_cached(FakeBlob("a", b"a"))
+        _download_cached(FakeBlob("b", b"b"))
+        now = time.time()
+        os.utime(import_cache / _md5(b"a").hex(), (now - 20, now - 20))
+        os.utime(import_cache / _md5(b"b").hex(), (now - 10, now - 10))
+
+        _download_cached(FakeBlob("c", b"c"))
+
+        assert sorted(p.name for p in import_cache.iterdir()) == sorted(
+            _md5(data).hex() for data in (b"b", b"c")
+        )
@@ -0,0 +1,101 @@
+"""Unit tests for the batch scoring helpers in src.utils.inference."""
+
+import numpy as np
+import pytest
+from sklearn.preprocessing import StandardScaler
+
+
+class TestScaleFeatures:
+    """scale_features must match scaler.transform() exactly."""
+
+    @pytest.mark.parametrize("with_mean", [True, False])
+    @pytest.mark.parametrize("with_std", [True, False])
+    def test_matches_transform(self, sample_features, with_mean, with_std):
+        """Every with_mean/with_std combination matches transform()."""
+        from src.utils.inference import scale_features
+
+        scaler = StandardScaler(with_mean=with_mean, with_std=with_std)
+        scaler.fit(sample_features)
+
+        expected = scaler.transform(sample_features).astype(np.float32)
+        scaled = scale_features(scaler, sample_features)
+
+        assert scaled.dtype == np.float32
+        np.testing.assert_array_equal(scaled, expected)
+
+    @pytest.mark.parametrize("with_mean", [True, False])
+    @pytest.mark.parametrize("with_std", [True, False])
+    def test_standardize_matches_transform(self, sample_features, with_mean, with_std):
+        """standardize() on a raw array matches transform() too."""
+        from src.utils.inference import standardize
+
+        scaler = StandardScaler(with_mean=with_mean, with_std=with_std)
+        scaler.fit(sample_features)
+        values = sample_features.to_numpy(dtype=np.float64)
+
+        expected = scaler.transform(sample_features).astype(np.float32)
+
+        np.testing.assert_array_equal(standardize(scaler, values), expected)
+
+    def test_reordered_columns_use_transform(self, fitted_scaler, sample_features):
+        """Columns in a different order fall back to transform()'s checks."""
+        from src.utils.inference import scale_features
+
+        reordered = sample_features[sample_features.columns[::-1]]
+
+        with pytest.raises(ValueError):
+            scale_features(fitted_scaler, reordered)
+
+
+class TestScaleFeaturesFrame:
+    """The scaled frame must wrap the scaled array, not copy it."""
+
+    def test_frame_shares_memory_with_scaled_array(
+        self, fitted_scaler, sample_features, monkeypatch
+    ):
+        """The DataFrame is built on the float32 array scale_features returns."""
+        from src.utils import inference
+
+        scaled = []
+
+        def capture(scaler, X):
+            scaled.append(inference.standardize(scaler, X.to_numpy(np.float64)))
+            return scaled[-1]
+
+        monkeypatch.setattr(inference, "scale_features", capture)
+
+        frame = inference.scale_features_frame(fitted_scaler, sample_features)
+
+        assert np.shares_memory(frame.to_numpy(), scaled[0])
+        assert list(frame.columns) == list(sample_features.columns)
+        assert frame.index.equals(sample_features.index)
+
+
+class TestParallelPredictProba:
+    """Chunked scoring must match a single predict_proba call."""
+
+    def test_chunked_matches_predict_proba(self, trained_model, sample_features):
+        """Thread-pool chunks stack back into the same probabilities."""
+        from src.utils.inference import parallel_predict_proba
+
+        probabilities = parallel_predict_proba(
+            trained_model, sample_features, chunk_size=7
+        )
+
+        np.testing.assert_array_equal(
+            probabilities, trained_model.predict_proba(sample_features)
+        )
+
+    def test_internally_parallel_model_matches(self, trained_model, sample_features):
+        """Models with n_jobs set are scored in one call, unchanged."""
+        from src.utils.inference import parallel_predict_proba
+
+        trained_model.set_params(n_jobs=2)
+
+        probabilities = parallel_predict_proba(
+            trained_model, sample_features, chunk_size=7
+        )
+
+        np.testing.assert_array_equal(
+            probabilities, trained_model.predict_proba(sample_features)
+        )
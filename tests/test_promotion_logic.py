@@ -4,7 +4,7 @@ These tests verify the promotion thresholds and validation rules
 without requiring a ZenML server connection.
 """
 
-# Extract promotion thresholds for testing (mirrors promote_model.py)
+# Extract promotion thresholds for testing (mirrors PROMOTION_REQUIREMENTS in scripts/promote_model.py)
 PROMOTION_REQUIREMENTS = {
     "staging": {
         "accuracy": 0.7,